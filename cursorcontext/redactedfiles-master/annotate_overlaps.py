@@ -44,8 +44,8 @@ def annotate_page_overlaps(
     Returns:
         Number of black rectangles with overlaps detected
     """
-    # Extract black rectangles
-    black_rects = extract_black_rectangles(page, black_threshold)
+    # Extract black rectangles (as Rects: they are annotated and positioned below)
+    black_rects = [fitz.Rect(r) for r in extract_black_rectangles(page, black_threshold)]
     
     # Get words with text content for display
     try:
@@ -0,0 +1,22 @@
+"""
+Compact JSON serialization shared by the batch extraction scripts.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise; both produce the same separator-free, non-ASCII-preserving text.
+"""
+
+import json
+
+# Optional: orjson for faster serialization of large result payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_compact(obj) -> str:
+    """Serialize to a compact JSON string (orjson when available)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
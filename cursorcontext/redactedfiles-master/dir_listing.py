@@ -0,0 +1,38 @@
+"""
+One-shot directory listing for the batch scripts' "is this file here?" checks.
+
+A single os.scandir() replaces an exists() stat per manifest row. Names are
+compared through os.path.normcase, so lookups match case-insensitively
+wherever the OS does (Windows), just as exists() would.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class DirectoryListing:
+    """Entries of one directory, looked up by name like exists() would."""
+    
+    def __init__(self, directory):
+        """
+        List the directory once; an unreadable or missing directory is empty.
+        
+        Args:
+            directory: Directory to list
+        """
+        self.paths: Dict[str, Path] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    self.paths[os.path.normcase(entry.name)] = Path(entry.path)
+        except OSError:
+            pass
+    
+    def __contains__(self, name: str) -> bool:
+        """True if the directory has an entry called name."""
+        return os.path.normcase(name) in self.paths
+    
+    def get(self, name: str) -> Optional[Path]:
+        """Return the path of the entry called name, or None if absent."""
+        return self.paths.get(os.path.normcase(name))
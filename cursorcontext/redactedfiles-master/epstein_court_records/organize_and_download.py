@@ -4,6 +4,7 @@ Organize and Download PDFs by Case
 Downloads PDFs from URLs and organizes them into case-based subdirectories
 """
 
+import os
 import re
 import sys
 import time
@@ -18,6 +19,9 @@ except ImportError:
     print("Install it with: pip install requests")
     sys.exit(1)
 
+# Accepted URL schemes (rejects look-alikes such as "httpfoo:")
+_HTTP_PREFIXES = ('http://', 'https://')
+
 def extract_case_name(url: str) -> str:
     """Extract case name from URL path."""
     # Parse URL
@@ -63,7 +67,7 @@ def organize_urls_by_case(urls: List[str]) -> Dict[str, List[str]]:
     
     for url in urls:
         url = url.strip()
-        if not url or not url.startswith('http'):
+        if not url.startswith(_HTTP_PREFIXES):
             continue
         
         case_name = extract_case_name(url)
@@ -97,9 +101,12 @@ def main():
             Path("pdf_urls.txt"),
             Path("urls.txt")
         ]
+        # List the working directory once; only stat nested candidates.
+        # normcase so the check matches case-insensitive filesystems
+        cwd_entries = {os.path.normcase(entry.name) for entry in os.scandir('.')}
         url_file = None
         for f in possible_files:
-            if f.exists():
+            if os.path.normcase(f.parts[0]) in cwd_entries and (len(f.parts) == 1 or f.exists()):
                 url_file = f
                 break
     
@@ -113,7 +120,7 @@ def main():
         try:
             for line in sys.stdin:
                 line = line.strip()
-                if line and line.startswith('http'):
+                if line.startswith(_HTTP_PREFIXES):
                     urls.append(line)
         except KeyboardInterrupt:
             print("\n\nInterrupted.", file=sys.stderr)
@@ -125,7 +132,7 @@ def main():
     else:
         print(f"Reading URLs from: {url_file}")
         urls = url_file.read_text(encoding='utf-8').splitlines()
-        urls = [u.strip() for u in urls if u.strip() and u.strip().startswith('http')]
+        urls = [s for s in (u.strip() for u in urls) if s.startswith(_HTTP_PREFIXES)]
         print(f"Found {len(urls)} URLs")
     
     # Organize by case
@@ -161,20 +168,21 @@ def main():
         # Create case directory
         case_dir = Path(case_name)
         case_dir.mkdir(exist_ok=True)
+        case_dir_s = str(case_dir)
         
         for i, url in enumerate(case_urls, 1):
             filename = get_filename_from_url(url)
-            output_path = case_dir / filename
+            output_path_s = os.path.join(case_dir_s, filename)
             
             # Skip if already exists
-            if output_path.exists():
+            if os.path.exists(output_path_s):
                 print(f"  [{i}/{len(case_urls)}] ⊙ Skipped (exists): {filename}")
                 total_downloaded += 1
                 continue
             
             print(f"  [{i}/{len(case_urls)}] ↓ Downloading: {filename}")
             
-            if download_file(url, output_path, session):
+            if download_file(url, Path(output_path_s), session):
                 total_downloaded += 1
             else:
                 total_failed += 1
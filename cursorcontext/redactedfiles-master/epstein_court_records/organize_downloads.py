@@ -5,25 +5,44 @@ Moves PDFs from Downloads folder into case-based subdirectories
 Looks for files downloaded with case____filename.pdf pattern
 """
 
+import errno
+import os
 import shutil
 import sys
 from pathlib import Path
 
 def find_downloads_folder() -> Path:
     """Find the user's Downloads folder."""
+    home = Path.home()
+    
+    # One directory listing instead of a stat per candidate; normcase so the
+    # check matches case-insensitive filesystems
+    try:
+        home_entries = {os.path.normcase(entry.name) for entry in os.scandir(home)}
+    except OSError:
+        home_entries = set()
+    
     # Common Windows Downloads locations
-    possible_paths = [
-        Path.home() / "Downloads",
-        Path.home() / "Download",
-        Path("C:/Users") / Path.home().name / "Downloads"
-    ]
+    for name in ("Downloads", "Download"):
+        if os.path.normcase(name) in home_entries:
+            return home / name
     
-    for path in possible_paths:
-        if path.exists():
-            return path
+    fallback = Path("C:/Users") / home.name / "Downloads"
+    if fallback.exists():
+        return fallback
     
     return None
 
+def move_file(source_file: Path, target_file: Path):
+    """Move a file, using a single atomic rename when both paths share a volume."""
+    try:
+        os.replace(source_file, target_file)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Cross-device: fall back to copy + delete
+        shutil.move(str(source_file), str(target_file))
+
 def organize_pdfs(downloads_folder: Path, output_folder: Path):
     """Organize PDFs from Downloads into case folders."""
     
@@ -66,16 +85,20 @@ def organize_pdfs(downloads_folder: Path, output_folder: Path):
     for case_name, files in sorted(cases.items()):
         case_folder = output_folder / case_name
         case_folder.mkdir(exist_ok=True, parents=True)
+        # normcase so the check matches case-insensitive filesystems
+        existing = {os.path.normcase(entry.name) for entry in os.scandir(case_folder)}
         
         print(f"\n[{case_name}]")
         for source_file, target_name in files:
             target_file = case_folder / target_name
+            target_key = os.path.normcase(target_name)
             
             try:
-                if target_file.exists():
+                if target_key in existing:
                     print(f"  ⊙ Skipped (exists): {target_name}")
                 else:
-                    shutil.move(str(source_file), str(target_file))
+                    move_file(source_file, target_file)
+                    existing.add(target_key)
                     print(f"  ✓ Moved: {target_name}")
                 moved += 1
             except Exception as e:
@@ -6,6 +6,20 @@ import fitz
 import pandas as pd
 from pathlib import Path
 
+# tqdm progress bar, or periodic "i/total" lines when tqdm is not installed
+from progress import tqdm
+
+# File presence checks from one directory read (case-insensitive on Windows)
+from dir_listing import DirectoryListing
+
+# Compact JSON for the serialized details (orjson when installed)
+from compact_json import dumps_compact
+
+# Text-only extraction: image blocks are never built, and spans outside the
+# mediabox are kept (the default clip would hide exactly the off-page text).
+# Used together with clip=fitz.INFINITE_RECT().
+HIDDEN_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES & ~fitz.TEXT_MEDIABOX_CLIP
+
 def extract_hidden_text(pdf_path):
     """Extract text that might be hidden (white-on-white, off-page, etc.)"""
     try:
@@ -18,60 +32,68 @@ def extract_hidden_text(pdf_path):
             'all_text': []
         }
         
+        # Bind the result lists once; every span is classified in a single pass
+        white_on_white = findings['white_on_white_text']
+        off_page = findings['off_page_text']
+        tiny = findings['tiny_text']
+        all_text = findings['all_text']
+        
         for page_num, page in enumerate(doc, 1):
             page_rect = page.rect
-            blocks = page.get_text("dict")["blocks"]
+            px0, py0, px1, py1 = page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y1
+            page_size = [page_rect.width, page_rect.height]
+            blocks = page.get_text("dict", flags=HIDDEN_TEXT_FLAGS, clip=fitz.INFINITE_RECT())["blocks"]
             
             for block in blocks:
-                if block.get("type") == 0:  # Text block
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            text = span.get("text", "").strip()
-                            if not text:
-                                continue
-                            
-                            bbox = span.get("bbox", [])
-                            color = span.get("color", 0)
-                            size = span.get("size", 0)
-                            
-                            # Check for white-on-white (color close to white = 16777215 or 1.0)
-                            # In RGB, white is (255, 255, 255) = 16777215 in decimal
-                            if color >= 16000000 or color == 1:
-                                findings['white_on_white_text'].append({
-                                    'page': page_num,
-                                    'text': text,
-                                    'color': color,
-                                    'size': size,
-                                    'bbox': bbox
-                                })
-                            
-                            # Check for off-page text (outside visible area)
-                            if bbox:
-                                x0, y0, x1, y1 = bbox
-                                if (x0 < page_rect.x0 or x1 > page_rect.x1 or 
-                                    y0 < page_rect.y0 or y1 > page_rect.y1):
-                                    findings['off_page_text'].append({
-                                        'page': page_num,
-                                        'text': text,
-                                        'bbox': bbox,
-                                        'page_size': [page_rect.width, page_rect.height]
-                                    })
-                            
-                            # Check for tiny text (size < 1)
-                            if size < 1 and size > 0:
-                                findings['tiny_text'].append({
+                if block.get("type") != 0:  # Text blocks only
+                    continue
+                for line in block.get("lines", []):
+                    for span in line.get("spans", []):
+                        text = span.get("text", "").strip()
+                        if not text:
+                            continue
+                        
+                        bbox = span.get("bbox", [])
+                        color = span.get("color", 0)
+                        size = span.get("size", 0)
+                        
+                        # Check for white-on-white (color close to white = 16777215 or 1.0)
+                        # In RGB, white is (255, 255, 255) = 16777215 in decimal
+                        if color >= 16000000 or color == 1:
+                            white_on_white.append({
+                                'page': page_num,
+                                'text': text,
+                                'color': color,
+                                'size': size,
+                                'bbox': bbox
+                            })
+                        
+                        # Check for off-page text (outside visible area)
+                        if bbox:
+                            x0, y0, x1, y1 = bbox
+                            if x0 < px0 or x1 > px1 or y0 < py0 or y1 > py1:
+                                off_page.append({
                                     'page': page_num,
                                     'text': text,
-                                    'size': size
+                                    'bbox': bbox,
+                                    'page_size': page_size
                                 })
-                            
-                            # Store all text for reference
-                            findings['all_text'].append({
+                        
+                        # Check for tiny text (size < 1)
+                        if 0 < size < 1:
+                            tiny.append({
                                 'page': page_num,
                                 'text': text,
-                                'color': color,
                                 'size': size
                             })
+                        
+                        # Store all text for reference
+                        all_text.append({
+                            'page': page_num,
+                            'text': text,
+                            'color': color,
+                            'size': size
+                        })
         
         doc.close()
         return findings
@@ -89,50 +111,54 @@ print("="*80 + "\n")
 
 base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
 
+# One directory listing instead of a stat per manifest row
+present = DirectoryListing(base_path)
+
 results = []
 
-for idx, row in df.iterrows():
-    filename = row['filename']
-    pdf_path = base_path / filename
-    
-    print(f"[{idx+1}/{len(df)}] Extracting from: {filename[:60]}...")
-    
-    if not pdf_path.exists():
-        print(f"  ERROR: File not found")
-        continue
-    
-    findings = extract_hidden_text(str(pdf_path))
-    
-    if 'error' in findings:
-        print(f"  ERROR: {findings['error']}")
-        continue
-    
-    white_count = len(findings['white_on_white_text'])
-    off_count = len(findings['off_page_text'])
-    tiny_count = len(findings['tiny_text'])
-    
-    print(f"  White-on-white: {white_count}, Off-page: {off_count}, Tiny: {tiny_count}")
-    
-    # Collect sample text
-    samples = []
-    if findings['white_on_white_text']:
-        samples.append("WHITE-ON-WHITE: " + findings['white_on_white_text'][0]['text'][:100])
-    if findings['off_page_text']:
-        samples.append("OFF-PAGE: " + findings['off_page_text'][0]['text'][:100])
-    if findings['tiny_text']:
-        samples.append("TINY: " + findings['tiny_text'][0]['text'][:100])
-    
-    results.append({
-        'filename': filename,
-        'risk_score': row['risk_score'],
-        'total_pages': findings['total_pages'],
-        'white_on_white_count': white_count,
-        'off_page_count': off_count,
-        'tiny_text_count': tiny_count,
-        'sample_hidden_text': ' | '.join(samples),
-        'all_white_on_white': str(findings['white_on_white_text'][:5]),  # First 5
-        'all_off_page': str(findings['off_page_text'][:5])
-    })
+# Full hit details go to a JSON Lines sidecar so the summary CSV stays slim
+with open('hidden_text_hits.jsonl', 'w', encoding='utf-8') as hits_file:
+    for filename, risk_score in tqdm(zip(df['filename'], df['risk_score']), total=len(df), unit='pdf'):
+        if filename not in present:
+            tqdm.write(f"{filename[:60]}: ERROR: File not found")
+            continue
+        
+        pdf_path = base_path / filename
+        
+        findings = extract_hidden_text(str(pdf_path))
+        
+        if 'error' in findings:
+            tqdm.write(f"{filename[:60]}: ERROR: {findings['error']}")
+            continue
+        
+        white_count = len(findings['white_on_white_text'])
+        off_count = len(findings['off_page_text'])
+        tiny_count = len(findings['tiny_text'])
+        
+        # Collect sample text
+        samples = []
+        if findings['white_on_white_text']:
+            samples.append("WHITE-ON-WHITE: " + findings['white_on_white_text'][0]['text'][:100])
+        if findings['off_page_text']:
+            samples.append("OFF-PAGE: " + findings['off_page_text'][0]['text'][:100])
+        if findings['tiny_text']:
+            samples.append("TINY: " + findings['tiny_text'][0]['text'][:100])
+        
+        results.append({
+            'filename': filename,
+            'risk_score': risk_score,
+            'total_pages': findings['total_pages'],
+            'white_on_white_count': white_count,
+            'off_page_count': off_count,
+            'tiny_text_count': tiny_count,
+            'sample_hidden_text': ' | '.join(samples)
+        })
+        
+        hits_file.write(dumps_compact({
+            'filename': filename,
+            'all_white_on_white': findings['white_on_white_text'][:5],  # First 5
+            'all_off_page': findings['off_page_text'][:5]
+        }) + '\n')
 
 # Save results
 output_df = pd.DataFrame(results)
@@ -146,6 +172,7 @@ print(f"Files with white-on-white text: {sum(1 for r in results if r['white_on_w
 print(f"Files with off-page text: {sum(1 for r in results if r['off_page_count'] > 0)}")
 print(f"Files with tiny text: {sum(1 for r in results if r['tiny_text_count'] > 0)}")
 print("\nSaved to: hidden_text_extraction_results.csv")
+print("Hit details: hidden_text_hits.jsonl")
 
 # Show most concerning files
 print("\n" + "="*80)
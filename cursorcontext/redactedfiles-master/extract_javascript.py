@@ -5,7 +5,15 @@ Extract and analyze JavaScript from court record PDFs
 import fitz
 import pandas as pd
 from pathlib import Path
-import json
+
+# tqdm progress bar, or periodic "i/total" lines when tqdm is not installed
+from progress import tqdm
+
+# File presence checks from one directory read (case-insensitive on Windows)
+from dir_listing import DirectoryListing
+
+# Compact JSON for the serialized details (orjson when installed)
+from compact_json import dumps_compact
 
 def extract_javascript_from_pdf(pdf_path):
     """Extract all JavaScript from a PDF"""
@@ -61,53 +69,54 @@ print("="*80 + "\n")
 
 base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
 
+# One directory listing instead of a stat per manifest row
+present = DirectoryListing(base_path)
+
 results = []
 
-for idx, row in df.iterrows():
-    filename = row['filename']
-    pdf_path = base_path / filename
-    
-    print(f"[{idx+1}/{len(df)}] Extracting from: {filename[:60]}...")
-    
-    if not pdf_path.exists():
-        print(f"  ERROR: File not found")
-        results.append({
-            'filename': filename,
-            'status': 'FILE_NOT_FOUND',
-            'javascript_count': 0,
-            'javascript_details': 'File not found'
-        })
-        continue
-    
-    js_code = extract_javascript_from_pdf(str(pdf_path))
-    
-    if js_code:
-        print(f"  Found {len(js_code)} JavaScript instance(s)")
+# Full JavaScript goes to a JSON Lines sidecar so the CSV only carries previews
+with open('javascript_full_code.jsonl', 'w', encoding='utf-8') as full_code_file:
+    for filename in tqdm(df['filename'], unit='pdf'):
+        if filename not in present:
+            tqdm.write(f"{filename[:60]}: ERROR: File not found")
+            results.append({
+                'filename': filename,
+                'status': 'FILE_NOT_FOUND',
+                'javascript_count': 0,
+                'javascript_details': 'File not found'
+            })
+            continue
+        
+        pdf_path = base_path / filename
         
-        # Format JavaScript details
-        js_details = []
-        for js in js_code:
-            if js['type'] == 'annotation':
-                js_details.append(f"Page {js['page']} ({js['annot_type']}): {js['code'][:100]}")
-            else:
-                js_details.append(f"{js['type']}: {js['code'][:100]}")
+        js_code = extract_javascript_from_pdf(str(pdf_path))
         
-        results.append({
-            'filename': filename,
-            'status': 'EXTRACTED',
-            'javascript_count': len(js_code),
-            'javascript_details': ' | '.join(js_details),
-            'full_code': json.dumps(js_code, indent=2)
-        })
-    else:
-        print(f"  WARNING: No JavaScript found (false positive?)")
-        results.append({
-            'filename': filename,
-            'status': 'NO_JS_FOUND',
-            'javascript_count': 0,
-            'javascript_details': 'pikepdf detected JS but PyMuPDF could not extract it',
-            'full_code': ''
-        })
+        if js_code:
+            # Format JavaScript details
+            js_details = []
+            for js in js_code:
+                if js['type'] == 'annotation':
+                    js_details.append(f"Page {js['page']} ({js['annot_type']}): {js['code'][:100]}")
+                else:
+                    js_details.append(f"{js['type']}: {js['code'][:100]}")
+            
+            results.append({
+                'filename': filename,
+                'status': 'EXTRACTED',
+                'javascript_count': len(js_code),
+                'javascript_details': ' | '.join(js_details),
+                'code_preview': js_code[0].get('code', '')[:300]
+            })
+            full_code_file.write(dumps_compact({'file': filename, 'js': js_code}) + '\n')
+        else:
+            tqdm.write(f"{filename[:60]}: WARNING: No JavaScript found (false positive?)")
+            results.append({
+                'filename': filename,
+                'status': 'NO_JS_FOUND',
+                'javascript_count': 0,
+                'javascript_details': 'pikepdf detected JS but PyMuPDF could not extract it',
+                'code_preview': ''
+            })
 
 # Save results
 output_df = pd.DataFrame(results)
@@ -121,6 +130,7 @@ print(f"JavaScript extracted: {sum(1 for r in results if r['status'] == 'EXTRACT
 print(f"No JS found: {sum(1 for r in results if r['status'] == 'NO_JS_FOUND')}")
 print(f"File errors: {sum(1 for r in results if r['status'] == 'FILE_NOT_FOUND')}")
 print("\nSaved to: javascript_extraction_results.csv")
+print("Full code: javascript_full_code.jsonl")
 
 # Show samples
 print("\n" + "="*80)
@@ -130,9 +140,7 @@ for r in results[:5]:
     if r['javascript_details'] and r['status'] == 'EXTRACTED':
         print(f"\nFile: {r['filename']}")
         print(f"Details: {r['javascript_details'][:200]}...")
-        if r['full_code']:
-            code_obj = json.loads(r['full_code'])
-            if code_obj:
-                print(f"Full code preview:\n{code_obj[0].get('code', '')[:300]}")
+        if r['code_preview']:
+            print(f"Full code preview:\n{r['code_preview']}")
 
 print("\n" + "="*80 + "\n")
@@ -7,6 +7,12 @@ import pandas as pd
 from pathlib import Path
 import zlib
 
+# tqdm progress bar, or periodic "i/total" lines when tqdm is not installed
+from progress import tqdm
+
+# File presence checks from one directory read (case-insensitive on Windows)
+from dir_listing import DirectoryListing
+
 def extract_and_decode_javascript(pdf_path):
     """Extract JavaScript and decode compressed streams"""
     try:
@@ -21,9 +27,9 @@ def extract_and_decode_javascript(pdf_path):
                 if '/Names' in js_names:
                     js_array = js_names.Names
                     # JavaScript is stored as pairs: [name, script]
-                    for i in range(0, len(js_array), 2):
-                        name = str(js_array[i])
-                        script_obj = js_array[i+1]
+                    pairs = iter(js_array)
+                    for name_obj, script_obj in zip(pairs, pairs):
+                        name = str(name_obj)
                         
                         if '/JS' in script_obj:
                             js_stream = script_obj.JS
@@ -60,6 +66,10 @@ print(f"Test file: {Path(test_file).name}\n")
 
 js_code = extract_and_decode_javascript(test_file)
 
+# The batch below reuses this parse for the test file rather than opening it
+# twice; errors are not reused since they may be transient
+test_js_code = js_code if not (js_code and js_code[0].get('type') == 'error') else None
+
 if js_code:
     print(f"Found {len(js_code)} JavaScript snippet(s)\n")
     for i, js in enumerate(js_code, 1):
@@ -83,23 +93,24 @@ print("="*80 + "\n")
 df = pd.read_csv('court_records_javascript_files.csv')
 base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
 
+# One directory listing instead of a stat per manifest row
+present = DirectoryListing(base_path)
+
 results = []
 
-for idx, row in df.iterrows():
-    filename = row['filename']
-    pdf_path = base_path / filename
-    
-    print(f"[{idx+1}/{len(df)}] {filename[:60]}...")
-    
-    if not pdf_path.exists():
-        print(f"  ERROR: File not found")
+for filename in tqdm(df['filename'], unit='pdf'):
+    if filename not in present:
+        tqdm.write(f"{filename[:60]}: ERROR: File not found")
         continue
     
-    js_code = extract_and_decode_javascript(str(pdf_path))
+    pdf_path = base_path / filename
+    
+    if test_js_code is not None and pdf_path == Path(test_file):
+        js_code = [dict(js) for js in test_js_code]
+    else:
+        js_code = extract_and_decode_javascript(str(pdf_path))
     
     if js_code and js_code[0].get('type') != 'error':
-        print(f"  ✓ Found {len(js_code)} JavaScript snippet(s)")
-        
         results.append({
             'filename': filename,
             'javascript_count': len(js_code),
@@ -109,7 +120,7 @@ for idx, row in df.iterrows():
         })
     else:
         error_msg = js_code[0].get('code', 'No JavaScript') if js_code else 'No JavaScript'
-        print(f"  ⚠️  {error_msg}")
+        tqdm.write(f"{filename[:60]}: ⚠️  {error_msg}")
         results.append({
             'filename': filename,
             'javascript_count': 0,
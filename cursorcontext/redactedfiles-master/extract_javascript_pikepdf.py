@@ -2,172 +2,292 @@
 Extract JavaScript using pikepdf (more thorough than PyMuPDF)
 """
 
+import csv
+import mmap
+import os
+import sys
 import pikepdf
-import pandas as pd
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import json
+from pdf_actions import walk_actions
+from results_cache import ResultsCache
 
-def extract_javascript_pikepdf(pdf_path):
-    """Extract JavaScript using pikepdf"""
+# Progress output is flushed once per this many files instead of every line
+PROGRESS_FLUSH_EVERY = 100
+
+# Bump when extraction logic changes to invalidate cached results
+# (2: earlier runs could cache error results)
+CACHE_VERSION = 2
+
+# Skip the qpdf parse for files whose raw bytes never mention JavaScript.
+# Skipped files are reported as SKIPPED_PREFILTER, not NO_JS: a marker can
+# still hide behind an escaped name, so set this to False for an exhaustive scan.
+PREFILTER_BYTE_SCAN = True
+
+# JS stored inside compressed object streams or encrypted files has no
+# plaintext marker, so either of the last two also means "parse it"
+JS_MARKERS = (b'/JavaScript', b'/JS', b'/ObjStm', b'/Encrypt')
+
+def may_contain_javascript(pdf_path):
+    """Cheap raw-byte check for a JavaScript marker (or a place one could hide)"""
+    with open(pdf_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: nothing to map, let pikepdf report it
+            return True
+        with mm:
+            return any(mm.find(marker) >= 0 for marker in JS_MARKERS)
+
+def iter_name_tree(tree):
+    """Yield (name, value) pairs from a name tree, including /Kids branches"""
+    try:
+        name_tree = pikepdf.NameTree(tree)
+    except AttributeError:
+        # Older pikepdf without NameTree: walk the flat /Names array only
+        if '/Names' in tree:
+            # Entries are stored as pairs: [name, value]
+            pairs = iter(tree.Names)
+            for name_obj, value in zip(pairs, pairs):
+                yield str(name_obj), value
+        return
+    yield from name_tree.items()
+
+# mmap lets qpdf read straight from the page cache instead of a heap copy
+ACCESS_MODE = getattr(pikepdf.AccessMode, 'mmap', pikepdf.AccessMode.default)
+
+def open_pdf(pdf_path):
+    """Open read-only without xref recovery, retrying with recovery on failure"""
+    try:
+        return pikepdf.open(pdf_path, attempt_recovery=False,
+                            suppress_warnings=True, access_mode=ACCESS_MODE)
+    except pikepdf.PdfError:
+        # Damaged xref: fall back to qpdf's repair pass
+        return pikepdf.open(pdf_path, access_mode=ACCESS_MODE)
+
+def extract_javascript_pikepdf(pdf_path, prefilter=False):
+    """
+    Extract JavaScript using pikepdf
+    
+    With prefilter=True, returns None without parsing when the raw bytes
+    contain no JavaScript marker.
+    """
     try:
-        pdf = pikepdf.open(pdf_path)
+        if prefilter and not may_contain_javascript(pdf_path):
+            return None
+        
+        pdf = open_pdf(pdf_path)
         js_found = []
         
+        # Resolve the catalog once; every Root access otherwise crosses into qpdf
+        root = pdf.Root
+        
         # Check catalog for JavaScript
-        if '/Names' in pdf.Root:
-            names = pdf.Root.Names
-            if '/JavaScript' in names:
-                js_names = names.JavaScript
-                if '/Names' in js_names:
-                    js_array = js_names.Names
-                    # JavaScript is stored as pairs: [name, script]
-                    for i in range(0, len(js_array), 2):
-                        name = str(js_array[i])
-                        script_obj = js_array[i+1]
-                        if '/JS' in script_obj:
-                            js_code = str(script_obj.JS)
-                            js_found.append({
-                                'type': 'document_javascript',
-                                'name': name,
-                                'code': js_code
-                            })
+        names = root.get('/Names')
+        js_names = names.get('/JavaScript') if names is not None else None
+        if js_names is not None:
+            for name, script_obj in iter_name_tree(js_names):
+                script_js = script_obj.get('/JS')
+                if script_js is not None:
+                    js_found.append({
+                        'type': 'document_javascript',
+                        'name': name,
+                        'code': str(script_js)
+                    })
         
-        # Check each page for annotations with JavaScript
-        for page_num, page in enumerate(pdf.pages, 1):
-            if '/Annots' in page:
-                for annot in page.Annots:
-                    annot_obj = pdf.pages[page_num-1].Annots[0]
-                    if '/A' in annot_obj:
-                        action = annot_obj.A
-                        if '/S' in action and str(action.S) == '/JavaScript':
-                            if '/JS' in action:
-                                js_code = str(action.JS)
-                                js_found.append({
-                                    'type': 'annotation_javascript',
-                                    'page': page_num,
-                                    'code': js_code
-                                })
-            
-            # Check for AA (Additional Actions)
-            if '/AA' in page:
-                aa = page.AA
-                for key in aa.keys():
-                    action = aa[key]
-                    if '/S' in action and str(action.S) == '/JavaScript':
-                        if '/JS' in action:
-                            js_code = str(action.JS)
-                            js_found.append({
-                                'type': f'page_action_{key}',
-                                'page': page_num,
-                                'code': js_code
-                            })
+        # Check each page's annotation and additional actions for JavaScript
+        for page_num, source, subtype, action in walk_actions(pdf):
+            if subtype != '/JavaScript':
+                continue
+            action_js = action.get('/JS')
+            if action_js is not None:
+                js_found.append({
+                    'type': 'annotation_javascript' if source == 'annotation' else source,
+                    'page': page_num,
+                    'code': str(action_js)
+                })
         
         # Check form fields for JavaScript
-        if '/AcroForm' in pdf.Root:
-            acroform = pdf.Root.AcroForm
-            if '/Fields' in acroform:
-                for field in acroform.Fields:
-                    if '/AA' in field:
-                        aa = field.AA
-                        for key in aa.keys():
-                            action = aa[key]
-                            if '/S' in action and str(action.S) == '/JavaScript':
-                                if '/JS' in action:
-                                    js_code = str(action.JS)
-                                    field_name = str(field.get('/T', 'Unknown'))
-                                    js_found.append({
-                                        'type': f'form_field_{key}',
-                                        'field': field_name,
-                                        'code': js_code
-                                    })
+        acroform = root.get('/AcroForm')
+        # Resolve the whole field list up front, in array order, so fields packed
+        # into the same object stream are read sequentially
+        fields = list(acroform.get('/Fields') or ()) if acroform is not None else []
+        for field in fields:
+            aa = field.get('/AA')
+            if aa is None:
+                continue
+            for key, action in aa.items():
+                if str(action.get('/S')) != '/JavaScript':
+                    continue
+                action_js = action.get('/JS')
+                if action_js is not None:
+                    field_name = str(field.get('/T', 'Unknown'))
+                    js_found.append({
+                        'type': f'form_field_{key}',
+                        'field': field_name,
+                        'code': str(action_js)
+                    })
         
         pdf.close()
         return js_found
     except Exception as e:
         return [{'type': 'error', 'code': str(e)}]
 
-# Read the JavaScript files CSV
-df = pd.read_csv('court_records_javascript_files.csv')
-
-print("\n" + "="*80)
-print("JAVASCRIPT EXTRACTION USING PIKEPDF")
-print("="*80)
-print(f"Analyzing {len(df)} files with JavaScript...")
-print("="*80 + "\n")
-
-base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
-
-results = []
-
-for idx, row in df.iterrows():
-    filename = row['filename']
-    pdf_path = base_path / filename
+def main():
+    # Read the JavaScript files CSV
+    with open('court_records_javascript_files.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
     
-    print(f"[{idx+1}/{len(df)}] Extracting from: {filename[:60]}...")
+    print("\n" + "="*80)
+    print("JAVASCRIPT EXTRACTION USING PIKEPDF")
+    print("="*80)
+    print(f"Analyzing {len(rows)} files with JavaScript...")
+    print("="*80 + "\n")
+    
+    base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
+    output_csv = 'javascript_extraction_pikepdf.csv'
+    fieldnames = ['filename', 'status', 'javascript_count', 'javascript_summary', 'full_details']
     
-    if not pdf_path.exists():
-        print(f"  ERROR: File not found")
-        continue
+    # Only per-status counts are kept in memory; rows go straight to the CSV
+    status_counts = Counter()
     
-    js_code = extract_javascript_pikepdf(str(pdf_path))
+    # Unchanged files (same mtime and size) reuse the previous run's result
+    cache = ResultsCache(Path('javascript_extraction_pikepdf.cache.json'), CACHE_VERSION)
     
-    if js_code and js_code[0].get('type') != 'error':
-        print(f"  ✓ Found {len(js_code)} JavaScript instance(s)")
+    # (filename, cached js_code or None, path, key), in manifest order
+    entries = []
+    for row in rows:
+        filename = row['filename']
+        pdf_path = base_path / filename
         
-        # Show preview
-        for js in js_code[:2]:  # Show first 2
-            print(f"    Type: {js['type']}")
-            code_preview = js['code'][:150].replace('\n', ' ')
-            print(f"    Code: {code_preview}...")
+        try:
+            key = ResultsCache.file_key(pdf_path)
+        except OSError:
+            print(f"{filename[:60]}: ERROR: File not found")
+            continue
         
-        results.append({
-            'filename': filename,
-            'status': 'EXTRACTED',
-            'javascript_count': len(js_code),
-            'javascript_summary': '; '.join([f"{js['type']}: {js['code'][:50]}" for js in js_code]),
-            'full_details': json.dumps(js_code, indent=2)
-        })
-    else:
-        error_msg = js_code[0].get('code', 'Unknown error') if js_code else 'No JavaScript found'
-        print(f"  ⚠️  {error_msg}")
-        results.append({
-            'filename': filename,
-            'status': 'ERROR' if 'error' in error_msg.lower() else 'NO_JS',
-            'javascript_count': 0,
-            'javascript_summary': error_msg,
-            'full_details': ''
-        })
-
-# Save results
-output_df = pd.DataFrame(results)
-output_df.to_csv('javascript_extraction_pikepdf.csv', index=False)
-
-print("\n" + "="*80)
-print("EXTRACTION COMPLETE")
-print("="*80)
-print(f"Total files analyzed: {len(results)}")
-print(f"JavaScript extracted: {sum(1 for r in results if r['status'] == 'EXTRACTED')}")
-print(f"No JS found: {sum(1 for r in results if r['status'] == 'NO_JS')}")
-print(f"Errors: {sum(1 for r in results if r['status'] == 'ERROR')}")
-print("\nSaved to: javascript_extraction_pikepdf.csv")
-
-# Show detailed analysis
-if results:
+        js_code = cache.get(filename, key)
+        if js_code is not None:
+            entries.append((filename, js_code, None, None))
+        else:
+            entries.append((filename, None, str(pdf_path), key))
+    
+    total = len(entries)
+    
+    def iter_results():
+        """
+        Yield (filename, js_code) in manifest order, cache hits in place.
+        js_code is None for files skipped by the byte prefilter.
+        """
+        # Each file is independent: parse them on all cores, write from the parent only.
+        # extract_javascript_pikepdf() reports its own errors, and map() keeps input order
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            parsed = executor.map(
+                partial(extract_javascript_pikepdf, prefilter=PREFILTER_BYTE_SCAN),
+                [path for _, cached_js, path, _ in entries if cached_js is None]
+            )
+            
+            for filename, js_code, path, key in entries:
+                if js_code is None:
+                    js_code = next(parsed)
+                    # Only successful parses are cached: prefilter skips (None) so
+                    # turning the prefilter off later still gets a full parse, and
+                    # errors because they may be transient (locked file, out of memory)
+                    if js_code is not None and not any(js.get('type') == 'error' for js in js_code):
+                        cache.put(filename, key, js_code)
+                yield filename, js_code
+    
+    # Workers never print; the parent buffers progress and flushes in batches
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
+    with open(output_csv, 'w', newline='', encoding='utf-8') as out_f:
+        writer = csv.DictWriter(out_f, fieldnames=fieldnames)
+        writer.writeheader()
+        
+        for done, (filename, js_code) in enumerate(iter_results(), 1):
+            if done % PROGRESS_FLUSH_EVERY == 0:
+                sys.stdout.flush()
+            print(f"[{done}/{total}] {filename[:60]}")
+            
+            if js_code is None:
+                print("  ⚠️  Skipped: no JavaScript marker in raw bytes (not parsed)")
+                result = {
+                    'filename': filename,
+                    'status': 'SKIPPED_PREFILTER',
+                    'javascript_count': 0,
+                    'javascript_summary': 'No JavaScript marker in raw bytes; not parsed',
+                    'full_details': ''
+                }
+            elif js_code and js_code[0].get('type') != 'error':
+                print(f"  ✓ Found {len(js_code)} JavaScript instance(s)")
+                
+                # Show preview
+                for js in js_code[:2]:  # Show first 2
+                    print(f"    Type: {js['type']}")
+                    code_preview = js['code'][:150].replace('\n', ' ')
+                    print(f"    Code: {code_preview}...")
+                
+                result = {
+                    'filename': filename,
+                    'status': 'EXTRACTED',
+                    'javascript_count': len(js_code),
+                    'javascript_summary': '; '.join([f"{js['type']}: {js['code'][:50]}" for js in js_code]),
+                    'full_details': json.dumps(js_code, separators=(',', ':'), ensure_ascii=False)
+                }
+            else:
+                error_msg = js_code[0].get('code', 'Unknown error') if js_code else 'No JavaScript found'
+                print(f"  ⚠️  {error_msg}")
+                result = {
+                    'filename': filename,
+                    'status': 'ERROR' if 'error' in error_msg.lower() else 'NO_JS',
+                    'javascript_count': 0,
+                    'javascript_summary': error_msg,
+                    'full_details': ''
+                }
+            
+            writer.writerow(result)
+            out_f.flush()
+            status_counts[result['status']] += 1
+    
+    sys.stdout.flush()
+    cache.save()
+    
     print("\n" + "="*80)
-    print("JAVASCRIPT ANALYSIS:")
+    print("EXTRACTION COMPLETE")
     print("="*80)
-    for r in results:
-        if r['status'] == 'EXTRACTED' and r['full_details']:
-            print(f"\n📄 FILE: {r['filename']}")
-            print(f"   Count: {r['javascript_count']} JavaScript snippets")
-            details = json.loads(r['full_details'])
-            for i, js in enumerate(details, 1):
-                print(f"\n   [{i}] Type: {js['type']}")
-                print(f"       Code length: {len(js['code'])} characters")
-                # Show full code if not too long
-                if len(js['code']) < 500:
-                    print(f"       Full code:\n{js['code']}")
-                else:
-                    print(f"       Code preview (first 300 chars):\n{js['code'][:300]}...")
+    print(f"Total files analyzed: {total}")
+    print(f"JavaScript extracted: {status_counts['EXTRACTED']}")
+    print(f"No JS found: {status_counts['NO_JS']}")
+    print(f"Skipped by byte prefilter: {status_counts['SKIPPED_PREFILTER']}")
+    print(f"Errors: {status_counts['ERROR']}")
+    print(f"\nSaved to: {output_csv}")
+    
+    # Show detailed analysis, streaming the rows back from the CSV
+    if status_counts['EXTRACTED']:
+        print("\n" + "="*80)
+        print("JAVASCRIPT ANALYSIS:")
+        print("="*80)
+        csv.field_size_limit(2**31 - 1)  # full_details cells can be large
+        with open(output_csv, newline='', encoding='utf-8') as in_f:
+            for r in csv.DictReader(in_f):
+                if r['status'] == 'EXTRACTED' and r['full_details']:
+                    print(f"\n📄 FILE: {r['filename']}")
+                    print(f"   Count: {r['javascript_count']} JavaScript snippets")
+                    details = json.loads(r['full_details'])
+                    for i, js in enumerate(details, 1):
+                        print(f"\n   [{i}] Type: {js['type']}")
+                        print(f"       Code length: {len(js['code'])} characters")
+                        # Show full code if not too long
+                        if len(js['code']) < 500:
+                            print(f"       Full code:\n{js['code']}")
+                        else:
+                            print(f"       Code preview (first 300 chars):\n{js['code'][:300]}...")
+    
+    print("\n" + "="*80 + "\n")
 
-print("\n" + "="*80 + "\n")
+if __name__ == "__main__":
+    main()
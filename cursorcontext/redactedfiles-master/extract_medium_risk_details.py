@@ -2,169 +2,269 @@
 Extract detailed information from top MEDIUM RISK PDFs
 """
 
+import csv
+import io
+import os
+import sys
 import fitz
 import pikepdf
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields as dataclass_fields
 from pathlib import Path
+from typing import List, Optional
+from pdf_actions import walk_actions
+from results_cache import ResultsCache
 
-# Read top 20 MEDIUM RISK files
-df = pd.read_csv('medium_risk_top20.csv')
-base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
+# Progress output is flushed once per this many files instead of every line
+PROGRESS_FLUSH_EVERY = 100
 
-print("="*80)
-print(f"DETAILED ANALYSIS OF TOP 20 MEDIUM RISK FILES")
-print("="*80)
-print()
+# Bump when analysis logic changes to invalidate cached results
+CACHE_VERSION = 2
 
-results = []
+# annot_xrefs() also lists these, but page.annots() never yields them
+SKIPPED_ANNOT_TYPES = (fitz.PDF_ANNOT_LINK, fitz.PDF_ANNOT_WIDGET, fitz.PDF_ANNOT_POPUP)
 
-for idx, row in df.iterrows():
-    filename = row['filename']
-    risk = row['risk_score']
-    pdf_path = base_path / filename
-    
-    print(f"\n[{idx+1}/20] Risk: {risk:.0f} | {filename[:60]}")
-    print("-"*80)
-    
-    if not pdf_path.exists():
-        print("  ⚠️  File not found")
-        continue
-    
-    details = {
-        'filename': filename,
-        'risk_score': risk,
-        'metadata_items': [],
-        'hidden_text_sample': None,
-        'signature_count': 0,
-        'annotation_count': 0,
-        'form_fields': 0,
-        'external_urls': [],
-        'page_count': 0
-    }
-    
-    try:
-        # Open with PyMuPDF for text and annotations
-        doc = fitz.open(str(pdf_path))
-        details['page_count'] = len(doc)
-        
-        # Check for annotations
-        annotation_count = 0
-        for page in doc:
-            annots = page.annots()
-            if annots:
-                annotation_count += len(list(annots))
-        details['annotation_count'] = annotation_count
-        
-        # Sample text from first page
-        if len(doc) > 0:
-            first_page_text = doc[0].get_text()[:200]
-            details['first_page_sample'] = first_page_text.replace('\n', ' ')[:100]
-        
-        doc.close()
-        
-        # Open with pikepdf for metadata, signatures, forms
-        pdf = pikepdf.open(str(pdf_path))
-        
-        # Metadata
-        if pdf.docinfo:
-            for key, value in pdf.docinfo.items():
-                if key not in ['/Producer', '/Creator', '/CreationDate', '/ModDate']:
-                    details['metadata_items'].append(f"{key}: {value}")
-        
-        # Check for signatures
-        if '/AcroForm' in pdf.Root:
-            form = pdf.Root.AcroForm
-            if '/Fields' in form:
-                fields = form.Fields
-                details['form_fields'] = len(fields)
-                
-                # Count signature fields
-                sig_count = 0
-                for field in fields:
-                    if '/FT' in field and field.FT == '/Sig':
-                        sig_count += 1
-                details['signature_count'] = sig_count
-        
-        # Check for external URLs in annotations
-        urls = set()
-        for page in pdf.pages:
-            if '/Annots' in page:
-                for annot in page.Annots:
-                    if '/A' in annot and '/URI' in annot.A:
-                        urls.add(str(annot.A.URI))
-        details['external_urls'] = list(urls)
+# Height in points of the first-page band sampled for first_page_sample
+FIRST_PAGE_SAMPLE_HEIGHT = 120
+
+@dataclass(slots=True)
+class PDFDetails:
+    """Findings for one medium-risk PDF; slotted to keep the results list small."""
+    filename: str
+    risk_score: float
+    metadata_items: List[str] = field(default_factory=list)
+    hidden_text_sample: Optional[str] = None
+    signature_count: int = 0
+    annotation_count: int = 0
+    form_fields: int = 0
+    external_urls: List[str] = field(default_factory=list)
+    page_count: int = 0
+    first_page_sample: str = ''
+
+def analyze_pdf(filename, risk, pdf_path):
+    """Collect metadata, annotation, form and URL details for one PDF"""
+    details = PDFDetails(filename=filename, risk_score=risk)
+    
+    # Read the file once and hand the same bytes to both libraries
+    data = Path(pdf_path).read_bytes()
+    
+    # Open with PyMuPDF for text and annotations
+    doc = fitz.open(stream=data, filetype='pdf')
+    details.page_count = len(doc)
+    
+    # Check for annotations (annot_xrefs() is a single C call per page)
+    details.annotation_count = sum(
+        1
+        for page in doc
+        for _, annot_type, _ in page.annot_xrefs()
+        if annot_type not in SKIPPED_ANNOT_TYPES
+    )
+    
+    # Sample text from the top of the first page; only lay out the whole
+    # page when that band is too sparse to fill the sample
+    if len(doc) > 0:
+        page = doc[0]
+        top = page.rect
+        top.y1 = min(top.y1, top.y0 + FIRST_PAGE_SAMPLE_HEIGHT)
+        first_page_text = page.get_text("text", clip=top)[:200]
+        if len(first_page_text) < 100:
+            first_page_text = page.get_text()[:200]
+        details.first_page_sample = first_page_text.replace('\n', ' ')[:100]
+    
+    doc.close()
+    
+    # Open with pikepdf for metadata, signatures, forms
+    pdf = pikepdf.open(io.BytesIO(data))
+    
+    # Metadata
+    if pdf.docinfo:
+        for key, value in pdf.docinfo.items():
+            if key not in ['/Producer', '/Creator', '/CreationDate', '/ModDate']:
+                details.metadata_items.append(f"{key}: {value}")
+    
+    # Check for signatures
+    form = pdf.Root.get('/AcroForm')
+    fields = form.get('/Fields') if form is not None else None
+    if fields is not None:
+        details.form_fields = len(fields)
         
-        pdf.close()
+        # Count signature fields
+        sig_count = 0
+        for field in fields:
+            if field.get('/FT') == '/Sig':
+                sig_count += 1
+        details.signature_count = sig_count
+    
+    # Check for external URLs in annotations
+    # Keyed by raw bytes so a URI repeated on every page is decoded only once
+    urls = {}
+    for page_num, source, subtype, action in walk_actions(pdf):
+        if source != 'annotation':
+            continue
+        uri = action.get('/URI')
+        if uri is not None:
+            raw = bytes(uri)
+            if raw not in urls:
+                urls[raw] = str(uri)
+    details.external_urls = list(urls.values())
+    
+    pdf.close()
+    
+    return details
+
+def print_details(details):
+    """Print the per-file summary lines"""
+    if details.metadata_items:
+        print(f"  📋 Metadata: {len(details.metadata_items)} items")
+        for item in details.metadata_items[:3]:
+            print(f"     - {item[:70]}")
+    
+    if details.annotation_count > 0:
+        print(f"  📝 Annotations: {details.annotation_count}")
+    
+    if details.signature_count > 0:
+        print(f"  ✍️  Signatures: {details.signature_count} signature fields")
+    
+    if details.form_fields > 0:
+        print(f"  📄 Form Fields: {details.form_fields}")
+    
+    if details.external_urls:
+        print(f"  🔗 External URLs: {len(details.external_urls)}")
+        for url in details.external_urls[:2]:
+            print(f"     - {url[:70]}")
+    
+    print(f"  📃 Pages: {details.page_count}")
+
+def main():
+    # Read top 20 MEDIUM RISK files
+    with open('medium_risk_top20.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
+    output_csv = 'medium_risk_detailed_analysis.csv'
+    fieldnames = [f.name for f in dataclass_fields(PDFDetails)]
+    
+    print("="*80)
+    print(f"DETAILED ANALYSIS OF TOP 20 MEDIUM RISK FILES")
+    print("="*80)
+    print()
+    
+    results = []
+    
+    # Unchanged files (same mtime and size) reuse the previous run's result
+    cache = ResultsCache(Path('medium_risk_detailed_analysis.cache.json'), CACHE_VERSION)
+    
+    # (filename, risk, cached details or None, path, key), in manifest order
+    entries = []
+    for row in rows:
+        filename = row['filename']
+        risk = float(row['risk_score'])
+        pdf_path = base_path / filename
         
-        # Print summary
-        if details['metadata_items']:
-            print(f"  📋 Metadata: {len(details['metadata_items'])} items")
-            for item in details['metadata_items'][:3]:
-                print(f"     - {item[:70]}")
+        try:
+            key = ResultsCache.file_key(pdf_path)
+        except OSError:
+            print(f"  ⚠️  File not found: {filename[:60]}")
+            continue
         
-        if details['annotation_count'] > 0:
-            print(f"  📝 Annotations: {details['annotation_count']}")
+        cached_details = cache.get(filename, key)
+        if cached_details is not None:
+            details = PDFDetails(**cached_details)
+            details.risk_score = risk
+            entries.append((filename, risk, details, None, None))
+        else:
+            entries.append((filename, risk, None, str(pdf_path), key))
+    
+    total = len(entries)
+    
+    def iter_results():
+        """Yield (filename, risk, details, error) in manifest (risk ranking) order"""
+        # Files are independent: analyze them on all cores, print from the parent only
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                index: executor.submit(analyze_pdf, filename, risk, path)
+                for index, (filename, risk, details, path, key) in enumerate(entries)
+                if details is None
+            }
+            
+            # Collect in input order; cache hits are yielded in place
+            for index, (filename, risk, details, path, key) in enumerate(entries):
+                if details is None:
+                    try:
+                        details = futures.pop(index).result()
+                    except Exception as e:
+                        yield filename, risk, None, e
+                        continue
+                    cache.put(filename, key, asdict(details))
+                yield filename, risk, details, None
+    
+    # Workers never print; the parent buffers progress and flushes in batches
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
+    # Rows are written as each file completes rather than buffered until the end
+    with open(output_csv, 'w', newline='', encoding='utf-8') as out_f:
+        writer = csv.DictWriter(out_f, fieldnames=fieldnames)
+        writer.writeheader()
         
-        if details['signature_count'] > 0:
-            print(f"  ✍️  Signatures: {details['signature_count']} signature fields")
+        for done, (filename, risk, details, error) in enumerate(iter_results(), 1):
+            if done % PROGRESS_FLUSH_EVERY == 0:
+                sys.stdout.flush()
+            print(f"\n[{done}/{total}] Risk: {risk:.0f} | {filename[:60]}")
+            print("-"*80)
+            
+            if error is not None:
+                print(f"  ❌ Error: {error}")
+                continue
+            
+            print_details(details)
+            writer.writerow(asdict(details))
+            out_f.flush()
+            results.append(details)
+    
+    sys.stdout.flush()
+    cache.save()
+    
+    print("\n" + "="*80)
+    print("SUMMARY OF FINDINGS")
+    print("="*80)
+    
+    if results:
+        total_metadata = sum(len(r.metadata_items) for r in results)
+        total_annots = sum(r.annotation_count for r in results)
+        total_sigs = sum(r.signature_count for r in results)
+        total_forms = sum(r.form_fields for r in results)
+        total_urls = sum(len(r.external_urls) for r in results)
         
-        if details['form_fields'] > 0:
-            print(f"  📄 Form Fields: {details['form_fields']}")
+        print(f"\nFiles analyzed: {len(results)}")
+        print(f"Total metadata items: {total_metadata}")
+        print(f"Total annotations: {total_annots}")
+        print(f"Total signature fields: {total_sigs}")
+        print(f"Total form fields: {total_forms}")
+        print(f"Total external URLs: {total_urls}")
         
-        if details['external_urls']:
-            print(f"  🔗 External URLs: {len(details['external_urls'])}")
-            for url in details['external_urls'][:2]:
-                print(f"     - {url[:70]}")
+        # Files with most issues
+        print("\nFiles with most signature fields:")
+        sorted_sigs = sorted(results, key=lambda x: x.signature_count, reverse=True)[:5]
+        for r in sorted_sigs:
+            if r.signature_count > 0:
+                print(f"  {r.signature_count:3d} sigs | {r.filename[:60]}")
         
-        print(f"  📃 Pages: {details['page_count']}")
+        print("\nFiles with most annotations:")
+        sorted_annots = sorted(results, key=lambda x: x.annotation_count, reverse=True)[:5]
+        for r in sorted_annots:
+            if r.annotation_count > 0:
+                print(f"  {r.annotation_count:3d} annots | {r.filename[:60]}")
         
-        results.append(details)
+        print("\nFiles with external URLs:")
+        for r in results:
+            if r.external_urls:
+                print(f"  {len(r.external_urls):2d} URLs | {r.filename[:60]}")
+                for url in r.external_urls:
+                    print(f"      → {url}")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
-        continue
-
-print("\n" + "="*80)
-print("SUMMARY OF FINDINGS")
-print("="*80)
-
-if results:
-    total_metadata = sum(len(r['metadata_items']) for r in results)
-    total_annots = sum(r['annotation_count'] for r in results)
-    total_sigs = sum(r['signature_count'] for r in results)
-    total_forms = sum(r['form_fields'] for r in results)
-    total_urls = sum(len(r['external_urls']) for r in results)
-    
-    print(f"\nFiles analyzed: {len(results)}")
-    print(f"Total metadata items: {total_metadata}")
-    print(f"Total annotations: {total_annots}")
-    print(f"Total signature fields: {total_sigs}")
-    print(f"Total form fields: {total_forms}")
-    print(f"Total external URLs: {total_urls}")
-    
-    # Files with most issues
-    print("\nFiles with most signature fields:")
-    sorted_sigs = sorted(results, key=lambda x: x['signature_count'], reverse=True)[:5]
-    for r in sorted_sigs:
-        if r['signature_count'] > 0:
-            print(f"  {r['signature_count']:3d} sigs | {r['filename'][:60]}")
-    
-    print("\nFiles with most annotations:")
-    sorted_annots = sorted(results, key=lambda x: x['annotation_count'], reverse=True)[:5]
-    for r in sorted_annots:
-        if r['annotation_count'] > 0:
-            print(f"  {r['annotation_count']:3d} annots | {r['filename'][:60]}")
-    
-    print("\nFiles with external URLs:")
-    for r in results:
-        if r['external_urls']:
-            print(f"  {len(r['external_urls']):2d} URLs | {r['filename'][:60]}")
-            for url in r['external_urls']:
-                print(f"      → {url}")
-    
-    # Save detailed results
-    result_df = pd.DataFrame(results)
-    result_df.to_csv('medium_risk_detailed_analysis.csv', index=False)
-    print("\n✓ Detailed results saved to: medium_risk_detailed_analysis.csv")
+        print(f"\n✓ Detailed results saved to: {output_csv}")
+    
+    print("\n" + "="*80)
 
-print("\n" + "="*80)
+if __name__ == "__main__":
+    main()
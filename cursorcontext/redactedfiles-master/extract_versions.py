@@ -6,37 +6,66 @@ This tool attempts to reconstruct earlier versions of a PDF by parsing
 each xref table and extracting the objects that were active at that point.
 """
 
+import json
+import mmap
+import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def find_xref_positions(pdf_data: bytes) -> List[int]:
-    """Find all startxref positions in the PDF."""
-    positions = []
-    pattern = b'startxref\n'
-    
-    pos = 0
-    while True:
-        pos = pdf_data.find(pattern, pos)
-        if pos == -1:
-            break
-        
-        # Read the number after startxref
-        num_start = pos + len(pattern)
-        num_end = pdf_data.find(b'\n', num_start)
-        
-        if num_end != -1:
-            try:
-                xref_offset = int(pdf_data[num_start:num_end].strip())
-                positions.append(xref_offset)
-            except ValueError:
-                pass
-        
-        pos += 1
+# Raw PDF contents: bytes, or a read-only mmap of the file
+PDFData = Union[bytes, mmap.mmap]
+
+# Byte patterns used when scanning raw PDF data, compiled once at import
+_STARTXREF_RE = re.compile(rb'startxref[\r\n]+(\d+)')
+_XREF_RE = re.compile(rb'xref\s+(\d+)\s+(\d+)')
+_BT_ET_RE = re.compile(rb'BT\s+(.*?)\s+ET', re.DOTALL)
+_PAREN_RE = re.compile(rb'\((.*?)\)')
+_OBJ_RE = re.compile(rb'(\d+)\s+\d+\s+obj')
+_STR_TJ_RE = re.compile(rb'\((.*?)\)(?:\s*Tj|\s*TJ)')
+
+
+@contextmanager
+def map_pdf(pdf_path: Path) -> Iterator[PDFData]:
+    """Map a PDF read-only so every pass shares one view instead of re-reading it."""
+    with open(pdf_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b''
+            return
+        with mm:
+            yield mm
+
+
+def write_json(path: Path, obj) -> None:
+    """Write obj as 2-space indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str))
+            return
+        except orjson.JSONEncodeError:
+            # e.g. an integer beyond 64 bits parsed from a malformed startxref
+            pass
     
-    return positions
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, default=str)
+
+
+def find_xref_positions(pdf_data: PDFData) -> List[int]:
+    """Find all startxref positions in the PDF."""
+    # One C-level pass finds each startxref and captures its offset digits
+    return [int(m.group(1)) for m in _STARTXREF_RE.finditer(pdf_data)]
 
 
 def extract_text_at_version(pdf_path: Path, xref_position: int) -> Dict:
@@ -51,32 +80,31 @@ def extract_text_at_version(pdf_path: Path, xref_position: int) -> Dict:
         'error': None
     }
     
+    # Object numbers are collected in a set and sorted once at the end
+    found = set()
+    
     try:
         with open(pdf_path, 'rb') as f:
-            # Read the entire file
-            pdf_data = f.read()
-            
             # Find the xref table at this position
             f.seek(xref_position)
             xref_data = f.read(10000)  # Read 10KB from xref position
             
             # Parse xref table entries
-            xref_match = re.search(rb'xref\s+(\d+)\s+(\d+)', xref_data)
+            xref_match = _XREF_RE.search(xref_data)
             if xref_match:
                 start_obj = int(xref_match.group(1))
                 num_objects = int(xref_match.group(2))
                 
-                result['objects_found'] = list(range(start_obj, start_obj + num_objects))
+                found.update(range(start_obj, start_obj + num_objects))
             
             # Look for text objects (BT...ET blocks) in the region
-            # This is a simplified approach
-            text_pattern = rb'BT\s+(.*?)\s+ET'
-            text_matches = re.findall(text_pattern, xref_data, re.DOTALL)
+            # This is a simplified approach; xref regions rarely hold a BT
+            # at all, so a literal scan skips the regex in the common case
+            text_matches = _BT_ET_RE.findall(xref_data) if b'BT' in xref_data else []
             
             for match in text_matches:
                 # Try to extract actual text strings
-                string_pattern = rb'\((.*?)\)'
-                strings = re.findall(string_pattern, match)
+                strings = _PAREN_RE.findall(match)
                 
                 for s in strings:
                     try:
@@ -92,21 +120,19 @@ def extract_text_at_version(pdf_path: Path, xref_position: int) -> Dict:
             region_data = f.read(xref_position - search_start)
             
             # Find all stream objects
-            obj_pattern = rb'(\d+)\s+\d+\s+obj'
-            obj_matches = re.finditer(obj_pattern, region_data)
+            obj_matches = _OBJ_RE.finditer(region_data)
             
-            for match in obj_matches:
-                obj_num = int(match.group(1))
-                if obj_num not in result['objects_found']:
-                    result['objects_found'].append(obj_num)
+            found.update(int(match.group(1)) for match in obj_matches)
     
     except Exception as e:
         result['error'] = str(e)
     
+    result['objects_found'] = sorted(found)
+    
     return result
 
 
-def extract_raw_content_sections(pdf_path: Path, xref_positions: List[int]) -> List[Dict]:
+def extract_raw_content_sections(pdf_data: PDFData, xref_positions: List[int]) -> List[Dict]:
     """
     Extract raw content sections between xref tables.
     Each section represents what was added in that version.
@@ -114,9 +140,6 @@ def extract_raw_content_sections(pdf_path: Path, xref_positions: List[int]) -> L
     sections = []
     
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf_data = f.read()
-        
         # Add boundaries
         boundaries = [0] + sorted(xref_positions) + [len(pdf_data)]
         
@@ -126,31 +149,36 @@ def extract_raw_content_sections(pdf_path: Path, xref_positions: List[int]) -> L
             
             section_data = pdf_data[start:end]
             
+            # has_content reuses these counts rather than rescanning the section
+            stream_count = section_data.count(b'stream')
+            bt_count = section_data.count(b'BT')
+            tj_count = section_data.count(b'Tj')
+            tj_array_count = section_data.count(b'TJ')
+            
             section = {
                 'version': i,
                 'start_byte': start,
                 'end_byte': end,
                 'size_bytes': end - start,
-                'content_preview': section_data[:500].decode('latin-1', errors='ignore'),
-                'stream_count': section_data.count(b'stream'),
-                'endstream_count': section_data.count(b'endstream'),
+                'content_preview': pdf_data[start:min(end, start + 500)].decode('latin-1', errors='ignore'),
+                'stream_count': stream_count,
+                # Every 'endstream' also contains 'stream', so none means zero
+                'endstream_count': section_data.count(b'endstream') if stream_count else 0,
                 'text_operators': {
-                    'BT_count': section_data.count(b'BT'),  # Begin Text
+                    'BT_count': bt_count,  # Begin Text
                     'ET_count': section_data.count(b'ET'),  # End Text
-                    'Tj_count': section_data.count(b'Tj'),  # Show text
-                    'TJ_count': section_data.count(b'TJ'),  # Show text array
+                    'Tj_count': tj_count,  # Show text
+                    'TJ_count': tj_array_count,  # Show text array
                 },
-                'has_content': b'stream' in section_data or b'BT' in section_data
+                'has_content': stream_count > 0 or bt_count > 0
             }
             
-            # Try to extract visible text strings
+            # Try to extract visible text strings (matches are consumed lazily);
+            # the pattern needs a Tj/TJ operator, so skip it when neither occurs
             text_strings = []
-            string_pattern = rb'\((.*?)\)(?:\s*Tj|\s*TJ)'
-            matches = re.findall(string_pattern, section_data)
-            
-            for match in matches:
+            for match in _STR_TJ_RE.finditer(section_data) if tj_count or tj_array_count else ():
                 try:
-                    decoded = match.decode('latin-1', errors='ignore')
+                    decoded = match.group(1).decode('latin-1', errors='ignore')
                     if decoded.strip() and len(decoded) < 200:
                         text_strings.append(decoded)
                 except:
@@ -166,101 +194,114 @@ def extract_raw_content_sections(pdf_path: Path, xref_positions: List[int]) -> L
     return sections
 
 
-def reconstruct_versions_with_pymupdf(pdf_path: Path, output_dir: Path) -> List[Dict]:
+def _process_version(job: Tuple[int, int, Path, Optional[int], Path, int]) -> Dict:
     """
-    Use PyMuPDF to try to reconstruct versions by reading the PDF at different points.
-    This is experimental and may not work for all PDFs.
+    Open one truncated version with PyMuPDF and save its PDF and text.
+    Runs in a worker process, which reads its own [:eof_end] prefix of the
+    file so only one prefix per worker is in memory; progress is printed
+    by the parent.
     """
     import fitz
-    import shutil
     
-    results = []
+    i, xref_pos, pdf_path, eof_end, output_dir, total = job
     
+    version_result = {
+        'version': i + 1,
+        'xref_position': xref_pos,
+        'success': False
+    }
+    
+    # No %%EOF after this xref: nothing to open
+    if eof_end is None:
+        return version_result
+    
+    # Try to open with PyMuPDF straight from memory
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf_data = f.read()
+        with map_pdf(pdf_path) as pdf_data:
+            truncated_data = pdf_data[:eof_end]
+        doc = fitz.open(stream=truncated_data, filetype="pdf")
         
-        # Find xref positions
-        xref_positions = find_xref_positions(pdf_data)
+        version_result['success'] = True
+        version_result['page_count'] = len(doc)
+        
+        # Extract text from this version; pages with neither content streams
+        # nor annotations (blank stub pages) cannot yield text, so skip them
+        all_text = "".join(
+            page.get_text()
+            for page in doc
+            if page.get_contents() or page.annot_xrefs()
+        )
+        
+        version_result['text'] = all_text
+        version_result['text_length'] = len(all_text)
         
+        # Save this version as a separate PDF
+        output_pdf = output_dir / f"version_{i + 1}_of_{total}.pdf"
+        output_pdf.write_bytes(truncated_data)
+        version_result['output_file'] = output_pdf.name
+        
+        # Save text to file
+        text_file = output_dir / f"version_{i + 1}_of_{total}.txt"
+        text_file.write_bytes("".join([
+            f"VERSION {i + 1} OF {total}\n",
+            "=" * 80 + "\n",
+            f"xref position: {xref_pos}\n",
+            f"Pages: {len(doc)}\n",
+            f"Text length: {len(all_text)} characters\n",
+            f"\n{'=' * 80}\n",
+            "EXTRACTED TEXT\n",
+            f"{'=' * 80}\n\n",
+            all_text,
+        ]).encode('utf-8'))
+        
+        version_result['text_file'] = text_file.name
+        
+        doc.close()
+        
+    except Exception as e:
+        version_result['error'] = str(e)
+    
+    return version_result
+
+
+def reconstruct_versions_with_pymupdf(pdf_path: Path, pdf_data: PDFData, xref_positions: List[int],
+                                      output_dir: Path) -> List[Dict]:
+    """
+    Use PyMuPDF to try to reconstruct versions by reading the PDF at different points.
+    This is experimental and may not work for all PDFs.
+    """
+    results = []
+    
+    try:
         if not xref_positions:
             return [{'error': 'No xref positions found'}]
         
-        print(f"Found {len(xref_positions)} versions (xref tables)")
+        total = len(xref_positions)
+        print(f"Found {total} versions (xref tables)")
         
-        # For each version, try to truncate the file at that point and open it
+        # Truncate the file at the %%EOF following each xref. Jobs carry only
+        # the end offset: workers read their own prefix, so the parent never
+        # holds (or pickles) a copy per version
+        eof_pattern = b'%%EOF'
+        jobs = []
         for i, xref_pos in enumerate(xref_positions):
-            print(f"\n  Processing Version {i + 1}/{len(xref_positions)}...")
-            
-            version_result = {
-                'version': i + 1,
-                'xref_position': xref_pos,
-                'success': False
-            }
-            
-            # Find the next %%EOF after this xref
-            eof_pattern = b'%%EOF'
             eof_pos = pdf_data.find(eof_pattern, xref_pos)
-            
-            if eof_pos != -1:
-                # Truncate at this EOF
-                truncated_data = pdf_data[:eof_pos + len(eof_pattern)]
-                
-                # Save truncated version
-                temp_file = output_dir / f"version_{i + 1}_temp.pdf"
-                with open(temp_file, 'wb') as f:
-                    f.write(truncated_data)
+            eof_end = eof_pos + len(eof_pattern) if eof_pos != -1 else None
+            jobs.append((i, xref_pos, pdf_path, eof_end, output_dir, total))
+        
+        # Versions are independent, so open them on all cores; map() keeps version order
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for version_result in executor.map(_process_version, jobs):
+                version = version_result['version']
+                print(f"\n  Processing Version {version}/{total}...")
                 
-                # Try to open with PyMuPDF
-                try:
-                    doc = fitz.open(str(temp_file))
-                    
-                    version_result['success'] = True
-                    version_result['page_count'] = len(doc)
-                    
-                    # Extract text from this version
-                    all_text = ""
-                    for page in doc:
-                        all_text += page.get_text()
-                    
-                    version_result['text'] = all_text
-                    version_result['text_length'] = len(all_text)
-                    
-                    # Save this version as a separate PDF
-                    output_pdf = output_dir / f"version_{i + 1}_of_{len(xref_positions)}.pdf"
-                    shutil.copy(str(temp_file), str(output_pdf))
-                    version_result['output_file'] = output_pdf.name
-                    
-                    # Save text to file
-                    text_file = output_dir / f"version_{i + 1}_of_{len(xref_positions)}.txt"
-                    with open(text_file, 'w', encoding='utf-8') as f:
-                        f.write(f"VERSION {i + 1} OF {len(xref_positions)}\n")
-                        f.write(f"=" * 80 + "\n")
-                        f.write(f"xref position: {xref_pos}\n")
-                        f.write(f"Pages: {len(doc)}\n")
-                        f.write(f"Text length: {len(all_text)} characters\n")
-                        f.write(f"\n{'=' * 80}\n")
-                        f.write(f"EXTRACTED TEXT\n")
-                        f.write(f"{'=' * 80}\n\n")
-                        f.write(all_text)
-                    
-                    version_result['text_file'] = text_file.name
-                    
-                    print(f"    ✓ Version {i + 1}: {len(doc)} page(s), {len(all_text)} chars of text")
-                    
-                    doc.close()
-                    
-                except Exception as e:
-                    version_result['error'] = str(e)
-                    print(f"    ✗ Version {i + 1}: Failed to open - {e}")
+                if 'error' in version_result:
+                    print(f"    ✗ Version {version}: Failed to open - {version_result['error']}")
+                elif version_result['success']:
+                    print(f"    ✓ Version {version}: {version_result['page_count']} page(s), "
+                          f"{version_result['text_length']} chars of text")
                 
-                # Clean up temp file
-                try:
-                    temp_file.unlink()
-                except:
-                    pass
-            
-            results.append(version_result)
+                results.append(version_result)
     
     except Exception as e:
         results.append({'error': str(e)})
@@ -294,7 +335,11 @@ def main():
     print(f"\n[Method 1] Reconstructing versions with PyMuPDF...")
     print("=" * 80)
     
-    results = reconstruct_versions_with_pymupdf(pdf_path, output_dir)
+    # Map the file once; both methods read from the same view
+    with map_pdf(pdf_path) as pdf_data:
+        xref_positions = find_xref_positions(pdf_data)
+        results = reconstruct_versions_with_pymupdf(pdf_path, pdf_data, xref_positions, output_dir)
+        sections = extract_raw_content_sections(pdf_data, xref_positions)
     
     # Summary
     print(f"\n{'=' * 80}")
@@ -324,17 +369,9 @@ def main():
     print(f"[Method 2] Analyzing raw content sections...")
     print(f"{'=' * 80}")
     
-    with open(pdf_path, 'rb') as f:
-        pdf_data = f.read()
-    
-    xref_positions = find_xref_positions(pdf_data)
-    sections = extract_raw_content_sections(pdf_path, xref_positions)
-    
     # Save section analysis
-    import json
     sections_file = output_dir / "section_analysis.json"
-    with open(sections_file, 'w', encoding='utf-8') as f:
-        json.dump(sections, f, indent=2, default=str)
+    write_json(sections_file, sections)
     
     print(f"\nSection analysis saved to: {sections_file.name}")
     
@@ -2,166 +2,243 @@
 Find PDFs with actual cryptographic digital signatures (not just form fields)
 """
 
+import csv
+import mmap
+import os
 import pikepdf
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from dir_listing import DirectoryListing
 
-# Read the full audit
-df = pd.read_csv('court_records_advanced_security_audit.csv')
+# A cryptographic signature dictionary always carries /ByteRange, and it
+# cannot live in a compressed object stream (its offsets point into the raw
+# file), so files without those bytes skip the pikepdf parse entirely.
+# Set to False to also report /Sig fields whose value lacks a ByteRange.
+PREFILTER_BYTE_SCAN = True
 
-# Convert signature_count to numeric
-df['signature_count'] = pd.to_numeric(df['signature_count'], errors='coerce').fillna(0)
+# Large write buffer so the result CSV goes out in few syscalls
+CSV_BUFFER_SIZE = 1 << 20
 
-# Get files that report having signatures
-sig_files = df[df['signature_count'] > 0].copy()
+# Optional signature dictionary entries: (PDF key, signature_info key)
+SIGNER_KEYS = (
+    ('/Name', 'signer_name'),
+    ('/Reason', 'reason'),
+    ('/Location', 'location'),
+    ('/M', 'date'),
+    ('/ContactInfo', 'contact'),
+)
 
-print("="*80)
-print(f"SEARCHING FOR CRYPTOGRAPHICALLY SIGNED PDFs")
-print("="*80)
-print(f"\nFiles reporting signature fields: {len(sig_files)}")
-print("Checking which files have ACTUAL digital signatures...\n")
+@lru_cache(maxsize=256)
+def _cached_name_str(name):
+    return str(name)
 
-base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
+def name_str(obj):
+    """str() of a PDF value, memoized for Names since files reuse a handful of them"""
+    if isinstance(obj, pikepdf.Name):
+        return _cached_name_str(obj)
+    return str(obj)
 
-signed_files = []
-unsigned_files = []
+def has_byterange(pdf_path):
+    """Cheap raw-byte check for a /ByteRange key anywhere in the file"""
+    with open(pdf_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: nothing to map, let pikepdf report it
+            return True
+        with mm:
+            return mm.find(b'/ByteRange') != -1
 
-for idx, row in sig_files.iterrows():
-    filename = row['filename']
-    pdf_path = base_path / filename
-    
-    if not pdf_path.exists():
-        continue
-    
+def inspect_pdf(pdf_path):
+    """
+    Open one PDF and collect details of signature fields that carry a value.
+    Runs in a worker process; returns (has_actual_signature, signature_info,
+    error) and leaves printing to the parent.
+    """
     try:
-        pdf = pikepdf.open(str(pdf_path))
+        if PREFILTER_BYTE_SCAN and not has_byterange(pdf_path):
+            return False, [], None
+        
+        pdf = pikepdf.open(pdf_path)
         
         has_actual_signature = False
         signature_info = []
         
         # Check for actual signatures
-        if '/AcroForm' in pdf.Root:
-            form = pdf.Root.AcroForm
-            
-            if '/Fields' in form:
-                fields = form.Fields
+        form = pdf.Root.get('/AcroForm')
+        fields = form.get('/Fields') if form is not None else None
+        
+        for field in fields if fields is not None else ():
+            try:
+                # Check if it's a signature field with a value
+                ft = field.get('/FT')
+                if ft is None or name_str(ft) != '/Sig':
+                    continue
+                field_name = str(field.get('/T', 'Unnamed'))
+                
+                # Check if it has a signature value (actual signature)
+                sig_dict = field.get('/V')
+                if sig_dict is None:
+                    continue
+                has_actual_signature = True
+                
+                # Extract signature details
+                sig_info = {
+                    'field_name': field_name,
+                    'type': name_str(sig_dict.get('/Type', '')),
+                    'filter': name_str(sig_dict.get('/Filter', '')),
+                    'sub_filter': name_str(sig_dict.get('/SubFilter', '')),
+                }
                 
-                for field in fields:
-                    try:
-                        # Check if it's a signature field with a value
-                        if '/FT' in field and str(field.FT) == '/Sig':
-                            field_name = str(field.get('/T', 'Unnamed'))
-                            
-                            # Check if it has a signature value (actual signature)
-                            if '/V' in field:
-                                has_actual_signature = True
-                                sig_dict = field.V
-                                
-                                # Extract signature details
-                                sig_info = {
-                                    'field_name': field_name,
-                                    'type': str(sig_dict.get('/Type', '')),
-                                    'filter': str(sig_dict.get('/Filter', '')),
-                                    'sub_filter': str(sig_dict.get('/SubFilter', '')),
-                                }
-                                
-                                # Get signer information if available
-                                if '/Name' in sig_dict:
-                                    sig_info['signer_name'] = str(sig_dict.Name)
-                                if '/Reason' in sig_dict:
-                                    sig_info['reason'] = str(sig_dict.Reason)
-                                if '/Location' in sig_dict:
-                                    sig_info['location'] = str(sig_dict.Location)
-                                if '/M' in sig_dict:
-                                    sig_info['date'] = str(sig_dict.M)
-                                if '/ContactInfo' in sig_dict:
-                                    sig_info['contact'] = str(sig_dict.ContactInfo)
-                                
-                                # Check for ByteRange (indicates cryptographic signature)
-                                if '/ByteRange' in sig_dict:
-                                    sig_info['has_byterange'] = True
-                                    sig_info['byterange'] = str(sig_dict.ByteRange)[:100]
-                                
-                                # Check for Contents (the actual signature data)
-                                if '/Contents' in sig_dict:
-                                    sig_info['has_signature_data'] = True
-                                    sig_info['signature_length'] = len(sig_dict.Contents)
-                                
-                                signature_info.append(sig_info)
-                    except Exception as e:
-                        continue
+                # Get signer information if available
+                for pdf_key, info_key in SIGNER_KEYS:
+                    value = sig_dict.get(pdf_key)
+                    if value is not None:
+                        sig_info[info_key] = str(value)
+                
+                # Check for ByteRange (indicates cryptographic signature)
+                byterange = sig_dict.get('/ByteRange')
+                if byterange is not None:
+                    sig_info['has_byterange'] = True
+                    sig_info['byterange'] = str(byterange)[:100]
+                
+                # Check for Contents (the actual signature data)
+                contents = sig_dict.get('/Contents')
+                if contents is not None:
+                    sig_info['has_signature_data'] = True
+                    sig_info['signature_length'] = len(bytes(contents))
+                
+                signature_info.append(sig_info)
+            except Exception as e:
+                continue
         
         pdf.close()
         
-        if has_actual_signature:
-            signed_files.append({
-                'filename': filename,
-                'risk_score': row['risk_score'],
-                'signature_count': int(row['signature_count']),
-                'actual_signatures': len(signature_info),
-                'signature_details': signature_info
-            })
-            
-            print(f"✓ SIGNED: {filename[:70]}")
-            for sig in signature_info:
-                print(f"  Field: {sig['field_name']}")
-                print(f"  Filter: {sig.get('filter', 'N/A')}")
-                if 'signer_name' in sig:
-                    print(f"  Signer: {sig['signer_name']}")
-                if 'reason' in sig:
-                    print(f"  Reason: {sig['reason']}")
-                if 'date' in sig:
-                    print(f"  Date: {sig['date']}")
-                if 'has_signature_data' in sig:
-                    print(f"  Signature Data: {sig['signature_length']} bytes")
-                print()
-        else:
-            unsigned_files.append({
-                'filename': filename,
-                'signature_fields': int(row['signature_count'])
-            })
-            
+        return has_actual_signature, signature_info, None
     except Exception as e:
-        print(f"✗ Error reading {filename[:60]}: {e}")
-        continue
+        return False, [], str(e)
 
-print("\n" + "="*80)
-print("SUMMARY")
-print("="*80)
-print(f"\nFiles with signature FIELDS: {len(sig_files)}")
-print(f"Files with ACTUAL cryptographic signatures: {len(signed_files)}")
-print(f"Files with empty signature fields only: {len(unsigned_files)}")
 
-if signed_files:
-    print("\n" + "-"*80)
-    print("CRYPTOGRAPHICALLY SIGNED FILES:")
-    print("-"*80)
-    for f in signed_files:
-        print(f"\n{f['filename']}")
-        print(f"  Risk Score: {f['risk_score']}")
-        print(f"  Signature fields: {f['signature_count']}")
-        print(f"  Actual signatures: {f['actual_signatures']}")
-        for sig in f['signature_details']:
-            print(f"\n  Signature Details:")
-            for key, value in sig.items():
-                if key not in ['has_byterange', 'has_signature_data']:
-                    print(f"    {key}: {str(value)[:80]}")
+def main():
+    # Read only the audit columns used below; blank signature counts become 0
+    df = pd.read_csv(
+        'court_records_advanced_security_audit.csv',
+        usecols=['filename', 'risk_score', 'signature_count'],
+        dtype={'signature_count': 'float32'},
+    ).fillna({'signature_count': 0})
+    
+    # Get files that report having signatures
+    sig_files = df[df['signature_count'] > 0]
+    
+    print("="*80)
+    print(f"SEARCHING FOR CRYPTOGRAPHICALLY SIGNED PDFs")
+    print("="*80)
+    print(f"\nFiles reporting signature fields: {len(sig_files)}")
+    print("Checking which files have ACTUAL digital signatures...\n")
     
-    # Save detailed results
-    result_df = pd.DataFrame([{
-        'filename': f['filename'],
-        'risk_score': f['risk_score'],
-        'signature_fields': f['signature_count'],
-        'actual_signatures': f['actual_signatures'],
-        'signer_names': ', '.join([s.get('signer_name', 'Unknown') for s in f['signature_details']]),
-        'signature_filters': ', '.join([s.get('filter', 'Unknown') for s in f['signature_details']]),
-        'signature_dates': ', '.join([s.get('date', 'Unknown') for s in f['signature_details']])
-    } for f in signed_files])
+    base_path = Path(r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file")
     
-    result_df.to_csv('cryptographically_signed_files.csv', index=False)
-    print("\n\n✓ Saved detailed results to: cryptographically_signed_files.csv")
-else:
-    print("\n⚠️  NO FILES WITH ACTUAL CRYPTOGRAPHIC SIGNATURES FOUND")
-    print("All signature fields appear to be empty form fields without actual signatures.")
+    signed_files = []
+    unsigned_files = []
+    
+    # One directory listing instead of a stat() per candidate
+    existing = DirectoryListing(base_path)
+    
+    rows = []
+    paths = []
+    columns = sig_files[['filename', 'risk_score', 'signature_count']]
+    for filename, risk_score, sig_count in columns.itertuples(index=False, name=None):
+        if filename not in existing:
+            continue
+        
+        rows.append((filename, risk_score, sig_count))
+        paths.append(str(base_path / filename))
+    
+    # Each file is parsed independently: inspect on all cores, report in input order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(inspect_pdf, paths, chunksize=8)
+        for (filename, risk_score, sig_count), (has_actual_signature, signature_info, error) in zip(rows, results):
+            
+            if error is not None:
+                print(f"✗ Error reading {filename[:60]}: {error}")
+                continue
+            
+            if has_actual_signature:
+                signed_files.append({
+                    'filename': filename,
+                    'risk_score': risk_score,
+                    'signature_count': int(sig_count),
+                    'actual_signatures': len(signature_info),
+                    'signature_details': signature_info
+                })
+                
+                print(f"✓ SIGNED: {filename[:70]}")
+                for sig in signature_info:
+                    print(f"  Field: {sig['field_name']}")
+                    print(f"  Filter: {sig.get('filter', 'N/A')}")
+                    if 'signer_name' in sig:
+                        print(f"  Signer: {sig['signer_name']}")
+                    if 'reason' in sig:
+                        print(f"  Reason: {sig['reason']}")
+                    if 'date' in sig:
+                        print(f"  Date: {sig['date']}")
+                    if 'has_signature_data' in sig:
+                        print(f"  Signature Data: {sig['signature_length']} bytes")
+                    print()
+            else:
+                unsigned_files.append({
+                    'filename': filename,
+                    'signature_fields': int(sig_count)
+                })
+    
+    print("\n" + "="*80)
+    print("SUMMARY")
+    print("="*80)
+    print(f"\nFiles with signature FIELDS: {len(sig_files)}")
+    print(f"Files with ACTUAL cryptographic signatures: {len(signed_files)}")
+    print(f"Files with empty signature fields only: {len(unsigned_files)}")
+    
+    if signed_files:
+        print("\n" + "-"*80)
+        print("CRYPTOGRAPHICALLY SIGNED FILES:")
+        print("-"*80)
+        for f in signed_files:
+            print(f"\n{f['filename']}")
+            print(f"  Risk Score: {f['risk_score']}")
+            print(f"  Signature fields: {f['signature_count']}")
+            print(f"  Actual signatures: {f['actual_signatures']}")
+            for sig in f['signature_details']:
+                print(f"\n  Signature Details:")
+                for key, value in sig.items():
+                    if key not in ['has_byterange', 'has_signature_data']:
+                        print(f"    {key}: {str(value)[:80]}")
+        
+        # Save detailed results
+        fieldnames = ['filename', 'risk_score', 'signature_fields', 'actual_signatures',
+                      'signer_names', 'signature_filters', 'signature_dates']
+        with open('cryptographically_signed_files.csv', 'w', newline='', encoding='utf-8',
+                  buffering=CSV_BUFFER_SIZE) as out_f:
+            writer = csv.writer(out_f, lineterminator='\n')
+            writer.writerow(fieldnames)
+            writer.writerows((
+                f['filename'],
+                f['risk_score'],
+                f['signature_count'],
+                f['actual_signatures'],
+                ', '.join([s.get('signer_name', 'Unknown') for s in f['signature_details']]),
+                ', '.join([s.get('filter', 'Unknown') for s in f['signature_details']]),
+                ', '.join([s.get('date', 'Unknown') for s in f['signature_details']])
+            ) for f in signed_files)
+        
+        print("\n\n✓ Saved detailed results to: cryptographically_signed_files.csv")
+    else:
+        print("\n⚠️  NO FILES WITH ACTUAL CRYPTOGRAPHIC SIGNATURES FOUND")
+        print("All signature fields appear to be empty form fields without actual signatures.")
+    
+    print("\n" + "="*80)
+
 
-print("\n" + "="*80)
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,20 @@ Deep dive into signature field structure
 import pikepdf
 from pathlib import Path
 
+# Display labels for well-known field keys; anything else prints its raw key
+FIELD_LABELS = {
+    '/FT': 'Type',
+    '/T': 'Name',
+    '/V': 'Value',
+    '/DV': 'Default Value',
+    '/Ff': 'Flags',
+    '/P': 'Page',
+    '/Rect': 'Rectangle',
+    '/AP': 'Appearance',
+    '/Lock': 'Lock',
+    '/SV': 'Seed Value',
+}
+
 # Analyze one file in detail
 test_file = r"C:\Users\vhalan\Desktop\redactedfiles\epstein_court_records\file\Doe 17 v. Indyke, No. 119-cv-09610 (S.D.N.Y. 2019)____003.pdf"
 
@@ -37,29 +51,14 @@ if '/AcroForm' in pdf.Root:
             
             # Get all field properties
             for key, value in field.items():
-                if key == '/FT':
-                    field_type = str(value)
-                    print(f"  Type: {field_type}")
-                    if '/Sig' in field_type:
-                        sig_count += 1
-                elif key == '/T':
-                    print(f"  Name: {value}")
-                elif key == '/V':
-                    print(f"  Value: {value}")
-                elif key == '/DV':
-                    print(f"  Default Value: {value}")
-                elif key == '/Ff':
-                    print(f"  Flags: {value}")
-                elif key == '/P':
-                    print(f"  Page: {value}")
-                elif key == '/Rect':
-                    print(f"  Rectangle: {value}")
-                elif key == '/AP':
-                    print(f"  Appearance: <stream>")
-                elif key == '/Lock':
-                    print(f"  Lock: {value}")
-                elif key == '/SV':
-                    print(f"  Seed Value: {value}")
+                if key == '/FT' and '/Sig' in str(value):
+                    sig_count += 1
+                
+                label = FIELD_LABELS.get(key)
+                if key == '/AP':
+                    print(f"  {label}: <stream>")
+                elif label is not None:
+                    print(f"  {label}: {value}")
                 else:
                     try:
                         print(f"  {key}: {str(value)[:80]}")
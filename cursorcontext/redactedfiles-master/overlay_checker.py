@@ -31,130 +31,427 @@ Usage examples:
 import argparse
 import json
 import csv
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 import pdf_overlay_audit as audit
 from pdf_security_audit import audit_pdf_security, SecurityFindings, format_security_report
 
+# Optional: orjson for faster JSON report serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def format_text_report(reports: List[audit.PDFRiskReport], security_enabled: bool = True, pdf_paths: Optional[Dict[str, Path]] = None) -> str:
+# Files ahead of the pool's progress to hint into the page cache, per worker
+PREFETCH_DEPTH_PER_WORKER = 2
+
+# Per-file security audit outcome: findings, or the exception the audit raised
+SecurityResult = Union[SecurityFindings, Exception]
+
+# Findings per resolved path with the st_mtime_ns they were computed at,
+# so each PDF is parsed at most once per invocation
+_security_cache: Dict[Path, Tuple[int, SecurityFindings]] = {}
+
+
+def _cached_security(pdf_path: Path, mtime_ns: int) -> Optional[SecurityFindings]:
+    """Return cached findings for a resolved path if the file has not changed since."""
+    entry = _security_cache.get(pdf_path)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+    return None
+
+
+# CSV report columns, in output order
+_CSV_FIELDS = (
+    "filename",
+    "total_pages",
+    "overlay_risk",
+    "flagged_pages",
+    "removable_overlay",
+    "has_metadata",
+    "metadata_keys",
+    "has_attachments",
+    "attachment_count",
+    "has_annotations",
+    "annotation_count",
+    "has_forms",
+    "form_field_count",
+    "has_layers",
+    "layer_count",
+    "has_javascript",
+    "has_actions",
+    "has_thumbnails",
+    "incremental_updates",
+    "security_notes",
+    "error"
+)
+
+# CSV security columns for PDFs without audit findings
+_NO_SECURITY_DATA = {
+    "has_metadata": "N/A",
+    "metadata_keys": "N/A",
+    "has_attachments": "N/A",
+    "attachment_count": "N/A",
+    "has_annotations": "N/A",
+    "annotation_count": "N/A",
+    "has_forms": "N/A",
+    "form_field_count": "N/A",
+    "has_layers": "N/A",
+    "layer_count": "N/A",
+    "has_javascript": "N/A",
+    "has_actions": "N/A",
+    "has_thumbnails": "N/A",
+    "incremental_updates": "N/A",
+    "security_notes": ""
+}
+
+
+def _risk_mask(security: SecurityFindings) -> int:
+    """Pack the findings that count for --security-risks-only into one bitmask (metadata excluded)."""
+    return (
+        security.has_attachments |
+        security.has_annotations << 1 |
+        security.has_forms << 2 |
+        security.has_layers << 3 |
+        security.has_javascript << 4 |
+        security.has_actions << 5 |
+        security.has_thumbnails << 6 |
+        security.incremental_updates_suspected << 7
+    )
+
+
+def _prefetch(pdf_path: Path) -> None:
+    """Ask the OS to start reading a file into the page cache (no-op where unsupported)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(pdf_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _map_with_prefetch(executor: ProcessPoolExecutor, fn, paths: List[Path], chunksize: int = 1) -> Iterator:
     """
-    Format reports as human-readable text.
+    executor.map() over paths, keeping a window of upcoming files prefetched.
+    
+    Disk reads for the next files overlap with parsing of the current ones
+    on cold-cache batch scans.
+    """
+    depth = (os.cpu_count() or 1) * PREFETCH_DEPTH_PER_WORKER
+    for path in paths[:depth]:
+        _prefetch(path)
+    
+    for i, result in enumerate(executor.map(fn, paths, chunksize=chunksize)):
+        if i + depth < len(paths):
+            _prefetch(paths[i + depth])
+        yield result
+
+
+def _audit_security_safe(pdf_path: Path) -> SecurityResult:
+    """Run audit_pdf_security, returning any exception so one bad PDF cannot abort the batch."""
+    try:
+        return audit_pdf_security(pdf_path)
+    except Exception as e:
+        return e
+
+
+def collect_security_findings(reports: List[audit.PDFRiskReport], pdf_paths: Optional[Dict[str, Path]] = None) -> Dict[str, SecurityResult]:
+    """
+    Run the security audit for every successfully scanned PDF in parallel.
+    
+    PyMuPDF is not thread-safe, so files are audited in worker processes.
     
     Args:
         reports: List of PDFRiskReport objects
-        security_enabled: Include security audit results
-        pdf_paths: Mapping of filename to full path for security audit
+        pdf_paths: Mapping of filename to full path, for reports that do
+            not carry their source_path
     
     Returns:
-        Formatted text string
+        Mapping of filename to SecurityFindings (or the exception raised);
+        files without a known path are omitted
     """
     if pdf_paths is None:
         pdf_paths = {}
     
-    lines = []
-    lines.append("=" * 80)
-    lines.append("PDF OVERLAY REDACTION RISK CHECKER - REPORT")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append("SECURITY NOTICE: This tool detects risk indicators only.")
-    lines.append("It does NOT extract or display any redacted content.")
-    lines.append("")
-    
-    total_pdfs = len(reports)
-    total_pages = sum(r.total_pages for r in reports if not r.error)
-    total_flagged_pages = sum(len(r.flagged_pages) for r in reports)
-    pdfs_with_risks = sum(1 for r in reports if r.flagged_pages)
-    pdfs_with_errors = sum(1 for r in reports if r.error)
-    
-    lines.append(f"Total PDFs scanned: {total_pdfs}")
-    lines.append(f"Total pages scanned: {total_pages}")
-    lines.append(f"PDFs with potential risks: {pdfs_with_risks}")
-    lines.append(f"Total pages flagged: {total_flagged_pages}")
-    lines.append(f"PDFs with errors: {pdfs_with_errors}")
-    lines.append("")
-    lines.append("-" * 80)
+    results: Dict[str, SecurityResult] = {}
+    tasks = []
+    for r in reports:
+        if r.error:
+            continue
+        full_path = r.source_path or pdf_paths.get(r.filename)
+        if full_path is None:
+            continue
+        # Normalize without resolve(): no per-component syscalls
+        full_path = Path(os.path.abspath(full_path))
+        try:
+            st = full_path.stat()
+        except OSError:
+            continue
+        
+        security = _cached_security(full_path, st.st_mtime_ns)
+        if security is not None:
+            results[r.filename] = security
+        else:
+            tasks.append((r.filename, full_path, st.st_mtime_ns, st.st_size))
+    
+    if not tasks:
+        return results
+    
+    # Largest files first so a big PDF does not start last and straggle
+    tasks.sort(key=lambda task: task[3], reverse=True)
+    
+    print(f"Running security audit on {len(tasks)} PDF(s)...", file=sys.stderr)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        audited = _map_with_prefetch(executor, _audit_security_safe, [task[1] for task in tasks])
+        for (filename, full_path, mtime_ns, _), result in zip(tasks, audited):
+            results[filename] = result
+            if isinstance(result, Exception):
+                print(f"  ⚠ Security audit failed for {filename}: {result}", file=sys.stderr)
+            else:
+                _security_cache[full_path] = (mtime_ns, result)
+    print(f"  ✓ Security audit completed", file=sys.stderr)
+    
+    return results
+
+
+def find_pdf_files(dir_path: Path, recursive: bool = False) -> List[Path]:
+    """
+    List the PDF files in a directory, in the order audit.audit_directory() scans them.
+    
+    Args:
+        dir_path: Path to directory
+        recursive: Whether to scan subdirectories
+    
+    Returns:
+        Sorted list of PDF file paths
+    """
+    # Walk with os.scandir so the file-type checks come from the directory
+    # entries instead of one stat() per match
+    pdf_files = []
+    stack = [dir_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif fnmatch(entry.name, "*.pdf") and entry.is_file():
+                        pdf_files.append(Path(entry.path))
+        except OSError:
+            # Unreadable directories are skipped, as glob() does
+            continue
+    return sorted(pdf_files)
+
+
+def _largest_first(paths: List[Path]) -> List[int]:
+    """Return indices into paths ordered by descending file size (stable for ties)."""
+    def size(i: int) -> int:
+        try:
+            return os.path.getsize(paths[i])
+        except OSError:
+            return 0
+    return sorted(range(len(paths)), key=size, reverse=True)
+
+
+def audit_pdfs(pdf_files: List[Path], **audit_kwargs) -> List[audit.PDFRiskReport]:
+    """
+    Run the overlay audit over many PDFs on all cores.
+    
+    Args:
+        pdf_files: PDF file paths to audit
+        **audit_kwargs: Additional arguments passed to audit.audit_pdf()
+    
+    Returns:
+        List of PDFRiskReport objects, in the same order as pdf_files
+    """
+    if not pdf_files:
+        return []
+    
+    # Dispatch largest files first (size approximates page count) so a big
+    # PDF does not start last and leave the other workers idle
+    order = _largest_first(pdf_files)
+    
+    reports: List[Optional[audit.PDFRiskReport]] = [None] * len(pdf_files)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = _map_with_prefetch(executor, partial(audit.audit_pdf, **audit_kwargs), [pdf_files[i] for i in order])
+        for i, report in zip(order, results):
+            reports[i] = report
+    return reports
+
+
+def summarize_reports(reports: List[audit.PDFRiskReport]) -> Dict[str, int]:
+    """
+    Compute the report summary counts in a single pass over the reports.
+    
+    Args:
+        reports: List of PDFRiskReport objects
+    
+    Returns:
+        Dictionary of summary counts, in report display order
+    """
+    total_pages = total_flagged_pages = pdfs_with_risks = pdfs_with_errors = 0
+    for r in reports:
+        if r.error:
+            pdfs_with_errors += 1
+        else:
+            total_pages += r.total_pages
+        n = len(r.flagged_pages)
+        total_flagged_pages += n
+        if n:
+            pdfs_with_risks += 1
+    
+    return {
+        "total_pdfs": len(reports),
+        "total_pages": total_pages,
+        "pdfs_with_risks": pdfs_with_risks,
+        "total_flagged_pages": total_flagged_pages,
+        "pdfs_with_errors": pdfs_with_errors
+    }
+
+
+def write_text_report(out_file, reports: List[audit.PDFRiskReport], security_enabled: bool = True, pdf_paths: Optional[Dict[str, Path]] = None, security_results: Optional[Dict[str, SecurityResult]] = None) -> None:
+    """
+    Write reports as human-readable text to an open text file.
+    
+    Args:
+        out_file: Text file (or sys.stdout) to write to
+        reports: List of PDFRiskReport objects
+        security_enabled: Include security audit results
+        pdf_paths: Mapping of filename to full path for security audit
+        security_results: Precomputed collect_security_findings() output;
+            computed here when omitted
+    """
+    if pdf_paths is None:
+        pdf_paths = {}
+    
+    if security_enabled and security_results is None:
+        security_results = collect_security_findings(reports, pdf_paths)
+    
+    w = out_file.write
+    w("=" * 80 + "\n")
+    w("PDF OVERLAY REDACTION RISK CHECKER - REPORT\n")
+    w("=" * 80 + "\n")
+    w("\n")
+    w("SECURITY NOTICE: This tool detects risk indicators only.\n")
+    w("It does NOT extract or display any redacted content.\n")
+    w("\n")
+    
+    summary = summarize_reports(reports)
+    
+    w(f"Total PDFs scanned: {summary['total_pdfs']}\n")
+    w(f"Total pages scanned: {summary['total_pages']}\n")
+    w(f"PDFs with potential risks: {summary['pdfs_with_risks']}\n")
+    w(f"Total pages flagged: {summary['total_flagged_pages']}\n")
+    w(f"PDFs with errors: {summary['pdfs_with_errors']}\n")
+    w("\n")
+    w("-" * 80 + "\n")
     
     # Report each PDF
     for report in reports:
-        lines.append("")
-        lines.append(f"File: {report.filename}")
+        # Fast path for the common case: a clean PDF with nothing else to report
+        if not security_enabled and not report.error and not report.flagged_pages:
+            w(f"\nFile: {report.filename}\n  Total pages: {report.total_pages}\n  Status: No risks detected\n")
+            continue
+        
+        w("\n")
+        w(f"File: {report.filename}\n")
         
         if report.error:
-            lines.append(f"  ERROR: {report.error}")
+            w(f"  ERROR: {report.error}\n")
             continue
         
-        lines.append(f"  Total pages: {report.total_pages}")
+        w(f"  Total pages: {report.total_pages}\n")
         
         if not report.flagged_pages:
-            lines.append("  Status: No risks detected")
+            w("  Status: No risks detected\n")
         else:
-            lines.append(f"  Status: {len(report.flagged_pages)} page(s) flagged")
-            lines.append("")
-            lines.append("  Flagged pages:")
+            w(f"  Status: {len(report.flagged_pages)} page(s) flagged\n")
+            w("\n")
+            w("  Flagged pages:\n")
             
             for risk in report.flagged_pages:
-                lines.append(
+                w(
                     f"    Page {risk.page_number}: "
                     f"{risk.black_rect_count} black rect(s), "
                     f"{risk.overlap_count} overlap(s) detected "
-                    f"[confidence: {risk.confidence_score}]"
+                    f"[confidence: {risk.confidence_score}]\n"
                 )
         
         # Security findings for this file
         if security_enabled and not report.error:
-            try:
-                print(f"  Running security audit on {report.filename}...", file=sys.stderr)
-                # Get full path for security audit
-                full_path = pdf_paths.get(report.filename)
-                if full_path and full_path.exists():
-                    security = audit_pdf_security(full_path)
-                    lines.append("")
-                    lines.append("  Security & Privacy Findings:")
-                    security_text = format_security_report(security, verbose=False)
-                    for line in security_text.split('\n')[2:]:  # Skip header
-                        if line.strip():
-                            lines.append(f"    {line}")
-                    print(f"  ✓ Security audit completed", file=sys.stderr)
-                else:
-                    lines.append("")
-                    lines.append(f"  Security audit: File path not found")
-            except Exception as e:
-                print(f"  ⚠ Security audit failed: {e}", file=sys.stderr)
-                lines.append("")
-                lines.append(f"  Security audit: Error - {type(e).__name__}")
+            security = security_results.get(report.filename)
+            if security is None:
+                w("\n")
+                w(f"  Security audit: File path not found\n")
+            elif isinstance(security, Exception):
+                w("\n")
+                w(f"  Security audit: Error - {type(security).__name__}\n")
+            else:
+                w("\n")
+                w("  Security & Privacy Findings:\n")
+                security_text = format_security_report(security, verbose=False)
+                for line in security_text.split('\n')[2:]:  # Skip header
+                    if line.strip():
+                        w(f"    {line}\n")
+    
+    w("\n")
+    w("=" * 80 + "\n")
+    w("REMINDER: These are heuristic findings. Manual verification required.\n")
+    w("=" * 80 + "\n")
+
+
+def format_text_report(reports: List[audit.PDFRiskReport], security_enabled: bool = True, pdf_paths: Optional[Dict[str, Path]] = None, security_results: Optional[Dict[str, SecurityResult]] = None) -> str:
+    """
+    Format reports as human-readable text.
     
-    lines.append("")
-    lines.append("=" * 80)
-    lines.append("REMINDER: These are heuristic findings. Manual verification required.")
-    lines.append("=" * 80)
+    Args:
+        reports: List of PDFRiskReport objects
+        security_enabled: Include security audit results
+        pdf_paths: Mapping of filename to full path for security audit
+        security_results: Precomputed collect_security_findings() output;
+            computed here when omitted
     
-    return "\n".join(lines)
+    Returns:
+        Formatted text string
+    """
+    import io
+    
+    output = io.StringIO()
+    write_text_report(output, reports, security_enabled=security_enabled, pdf_paths=pdf_paths,
+                      security_results=security_results)
+    return output.getvalue().rstrip("\n")
 
 
-def format_json_report(reports: List[audit.PDFRiskReport]) -> str:
+def build_json_report(reports: List[audit.PDFRiskReport]) -> Dict:
     """
-    Format reports as JSON.
+    Build the JSON report structure.
     
     Args:
         reports: List of PDFRiskReport objects
     
     Returns:
-        JSON string
+        Dictionary ready for JSON serialization
     """
     data = {
         "tool": "PDF Overlay Redaction Risk Checker",
         "security_notice": "This tool detects risk indicators only. No redacted content is extracted or displayed.",
         "disclaimer": "Findings are heuristic and may include false positives. Manual verification required.",
-        "summary": {
-            "total_pdfs": len(reports),
-            "total_pages": sum(r.total_pages for r in reports if not r.error),
-            "pdfs_with_risks": sum(1 for r in reports if r.flagged_pages),
-            "total_flagged_pages": sum(len(r.flagged_pages) for r in reports),
-            "pdfs_with_errors": sum(1 for r in reports if r.error)
-        },
+        "summary": summarize_reports(reports),
         "reports": []
     }
     
@@ -177,153 +474,146 @@ def format_json_report(reports: List[audit.PDFRiskReport]) -> str:
         
         data["reports"].append(report_data)
     
+    return data
+
+
+def format_json_report(reports: List[audit.PDFRiskReport]) -> str:
+    """
+    Format reports as JSON.
+    
+    Args:
+        reports: List of PDFRiskReport objects
+    
+    Returns:
+        JSON string
+    """
+    data = build_json_report(reports)
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
     return json.dumps(data, indent=2)
 
 
-def format_csv_report(reports: List[audit.PDFRiskReport], security_enabled: bool = True, pdf_paths: Optional[Dict[str, Path]] = None, risks_only: bool = False) -> str:
+def iter_csv_rows(reports: List[audit.PDFRiskReport], security_enabled: bool = True, pdf_paths: Optional[Dict[str, Path]] = None, risks_only: bool = False, security_results: Optional[Dict[str, SecurityResult]] = None) -> Iterator[Dict[str, object]]:
     """
-    Format reports as CSV with security audit findings.
+    Yield one CSV row per report with security audit findings.
     
     Args:
         reports: List of PDFRiskReport objects
         security_enabled: Include security audit results
         pdf_paths: Mapping of filename to full path for security audit
         risks_only: Only include PDFs with security risks beyond metadata
+        security_results: Precomputed collect_security_findings() output;
+            computed here when omitted
     
-    Returns:
-        CSV string
+    Yields:
+        Rows as dictionaries keyed by the _CSV_FIELDS column names
     """
     if pdf_paths is None:
         pdf_paths = {}
     
-    import io
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header with security columns
-    writer.writerow([
-        "filename",
-        "total_pages",
-        "overlay_risk",
-        "flagged_pages",
-        "removable_overlay",
-        "has_metadata",
-        "metadata_keys",
-        "has_attachments",
-        "attachment_count",
-        "has_annotations",
-        "annotation_count",
-        "has_forms",
-        "form_field_count",
-        "has_layers",
-        "layer_count",
-        "has_javascript",
-        "has_actions",
-        "has_thumbnails",
-        "incremental_updates",
-        "security_notes",
-        "error"
-    ])
+    if security_enabled and security_results is None:
+        security_results = collect_security_findings(reports, pdf_paths)
     
     # Data rows
     for report in reports:
-        # Initialize security data
-        sec_data = {
-            "has_metadata": "N/A",
-            "metadata_keys": "N/A",
-            "has_attachments": "N/A",
-            "attachment_count": "N/A",
-            "has_annotations": "N/A",
-            "annotation_count": "N/A",
-            "has_forms": "N/A",
-            "form_field_count": "N/A",
-            "has_layers": "N/A",
-            "layer_count": "N/A",
-            "has_javascript": "N/A",
-            "has_actions": "N/A",
-            "has_thumbnails": "N/A",
-            "incremental_updates": "N/A",
-            "security_notes": ""
-        }
+        flagged_pages = report.flagged_pages
         
-        # Run security audit if enabled
+        security = None
         if security_enabled and not report.error:
-            try:
-                full_path = pdf_paths.get(report.filename)
-                if full_path and full_path.exists():
-                    security = audit_pdf_security(full_path)
-                    sec_data = {
-                        "has_metadata": "YES" if security.has_metadata else "NO",
-                        "metadata_keys": str(len(security.metadata_keys)) if security.has_metadata else "0",
-                        "has_attachments": "YES" if security.has_attachments else "NO",
-                        "attachment_count": str(security.attachment_count),
-                        "has_annotations": "YES" if security.has_annotations else "NO",
-                        "annotation_count": str(security.annotation_count),
-                        "has_forms": "YES" if security.has_forms else "NO",
-                        "form_field_count": str(security.form_field_count),
-                        "has_layers": "YES" if security.has_layers else "NO",
-                        "layer_count": str(security.layer_count),
-                        "has_javascript": "YES" if security.has_javascript else "NO",
-                        "has_actions": "YES" if security.has_actions else "NO",
-                        "has_thumbnails": "YES" if security.has_thumbnails else "NO",
-                        "incremental_updates": "YES" if security.incremental_updates_suspected else "NO",
-                        "security_notes": "; ".join(security.notes) if security.notes else ""
-                    }
-            except Exception as e:
-                sec_data["security_notes"] = f"Security audit error: {type(e).__name__}"
+            security = security_results.get(report.filename)
+        
+        # Filter for risks-only mode before formatting anything: rows without
+        # findings (disabled, missing or failed audit) only count overlay risks
+        if risks_only and not flagged_pages:
+            risk_mask = _risk_mask(security) if isinstance(security, SecurityFindings) else 0
+            if risk_mask == 0:
+                continue  # Skip this PDF
+        
+        # Security data
+        if isinstance(security, SecurityFindings):
+            sec_data = {
+                "has_metadata": "YES" if security.has_metadata else "NO",
+                "metadata_keys": str(len(security.metadata_keys)) if security.has_metadata else "0",
+                "has_attachments": "YES" if security.has_attachments else "NO",
+                "attachment_count": str(security.attachment_count),
+                "has_annotations": "YES" if security.has_annotations else "NO",
+                "annotation_count": str(security.annotation_count),
+                "has_forms": "YES" if security.has_forms else "NO",
+                "form_field_count": str(security.form_field_count),
+                "has_layers": "YES" if security.has_layers else "NO",
+                "layer_count": str(security.layer_count),
+                "has_javascript": "YES" if security.has_javascript else "NO",
+                "has_actions": "YES" if security.has_actions else "NO",
+                "has_thumbnails": "YES" if security.has_thumbnails else "NO",
+                "incremental_updates": "YES" if security.incremental_updates_suspected else "NO",
+                "security_notes": "; ".join(security.notes) if security.notes else ""
+            }
+        else:
+            sec_data = dict(_NO_SECURITY_DATA)
+            if isinstance(security, Exception):
+                sec_data["security_notes"] = f"Security audit error: {type(security).__name__}"
         
         # Determine if overlay is removable (high confidence)
         removable_overlay = "N/A"
-        if report.flagged_pages:
+        if flagged_pages:
             # Check if any flagged page has high confidence (likely removable)
-            high_conf_pages = [p for p in report.flagged_pages if p.confidence_score >= 0.7]
-            if high_conf_pages:
+            if any(p.confidence_score >= 0.7 for p in flagged_pages):
                 removable_overlay = "YES"
             else:
                 removable_overlay = "MAYBE"
         
-        # Filter for risks-only mode
-        if risks_only:
-            has_significant_risk = (
-                report.flagged_pages or  # Has overlay risks
-                sec_data["has_attachments"] == "YES" or
-                sec_data["has_annotations"] == "YES" or
-                sec_data["has_forms"] == "YES" or
-                sec_data["has_layers"] == "YES" or
-                sec_data["has_javascript"] == "YES" or
-                sec_data["has_actions"] == "YES" or
-                sec_data["has_thumbnails"] == "YES" or
-                sec_data["incremental_updates"] == "YES"
-            )
-            if not has_significant_risk:
-                continue  # Skip this PDF
-        
-        # Write row with all data
-        writer.writerow([
-            report.filename,
-            report.total_pages,
-            "YES" if report.flagged_pages else "NO",
-            len(report.flagged_pages),
-            removable_overlay,
-            sec_data["has_metadata"],
-            sec_data["metadata_keys"],
-            sec_data["has_attachments"],
-            sec_data["attachment_count"],
-            sec_data["has_annotations"],
-            sec_data["annotation_count"],
-            sec_data["has_forms"],
-            sec_data["form_field_count"],
-            sec_data["has_layers"],
-            sec_data["layer_count"],
-            sec_data["has_javascript"],
-            sec_data["has_actions"],
-            sec_data["has_thumbnails"],
-            sec_data["incremental_updates"],
-            sec_data["security_notes"],
-            report.error or ""
-        ])
+        # Row with all data
+        sec_data["filename"] = report.filename
+        sec_data["total_pages"] = report.total_pages
+        sec_data["overlay_risk"] = "YES" if flagged_pages else "NO"
+        sec_data["flagged_pages"] = len(flagged_pages)
+        sec_data["removable_overlay"] = removable_overlay
+        sec_data["error"] = report.error or ""
+        yield sec_data
+
+
+def write_csv_report(out_file, reports: List[audit.PDFRiskReport], **kwargs) -> int:
+    """
+    Stream the CSV report to an open text file as rows are produced.
+    
+    Args:
+        out_file: Text file opened with newline=''
+        reports: List of PDFRiskReport objects
+        **kwargs: Additional arguments passed to iter_csv_rows()
+    
+    Returns:
+        Number of data rows written (excluding the header)
+    """
+    writer = csv.DictWriter(out_file, fieldnames=_CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    
+    row_count = 0
+    for row in iter_csv_rows(reports, **kwargs):
+        writer.writerow(row)
+        row_count += 1
+    return row_count
+
+
+def format_csv_report(reports: List[audit.PDFRiskReport], security_enabled: bool = True, pdf_paths: Optional[Dict[str, Path]] = None, risks_only: bool = False, security_results: Optional[Dict[str, SecurityResult]] = None) -> str:
+    """
+    Format reports as CSV with security audit findings.
+    
+    Args:
+        reports: List of PDFRiskReport objects
+        security_enabled: Include security audit results
+        pdf_paths: Mapping of filename to full path for security audit
+        risks_only: Only include PDFs with security risks beyond metadata
+        security_results: Precomputed collect_security_findings() output;
+            computed here when omitted
+    
+    Returns:
+        CSV string
+    """
+    import io
     
+    output = io.StringIO()
+    write_csv_report(output, reports, security_enabled=security_enabled, pdf_paths=pdf_paths,
+                     risks_only=risks_only, security_results=security_results)
     return output.getvalue()
 
 
@@ -439,7 +729,6 @@ IMPORTANT:
     
     # Perform audit
     reports: List[audit.PDFRiskReport] = []
-    pdf_paths = {}  # Map filename to full path for security audit
     
     if input_path.is_file():
         if input_path.suffix.lower() != ".pdf":
@@ -448,19 +737,10 @@ IMPORTANT:
         
         report = audit.audit_pdf(input_path, **audit_kwargs)
         reports.append(report)
-        pdf_paths[report.filename] = input_path
     
     elif input_path.is_dir():
-        reports = audit.audit_directory(input_path, args.recursive, **audit_kwargs)
-        
-        # Build path mapping for directory scans
-        if args.recursive:
-            pdf_files = list(input_path.rglob("*.pdf"))
-        else:
-            pdf_files = list(input_path.glob("*.pdf"))
-        
-        for pdf_file in pdf_files:
-            pdf_paths[pdf_file.name] = pdf_file
+        pdf_files = find_pdf_files(input_path, args.recursive)
+        reports = audit_pdfs(pdf_files, **audit_kwargs)
         
         if not reports:
             print(f"Warning: No PDF files found in {input_path}", file=sys.stderr)
@@ -473,31 +753,53 @@ IMPORTANT:
     # Format output
     security_enabled = not args.no_security_audit
     
+    # Audit every file's security once, up front, across all cores; each
+    # report already carries the path it was scanned from
+    security_results = None
+    if security_enabled and not args.json:
+        security_results = collect_security_findings(reports)
+    
     if args.json:
-        output_text = format_json_report(reports)
-    elif args.csv:
-        output_text = format_csv_report(reports, security_enabled=security_enabled, pdf_paths=pdf_paths, risks_only=args.security_risks_only)
-        # Log count if filtering for risks only
-        if args.security_risks_only:
-            risk_count = output_text.count('\n') - 1  # Subtract header row
-            print(f"Found {risk_count} PDF(s) with significant security risks (beyond metadata only)", file=sys.stderr)
-    else:
-        output_text = format_text_report(reports, security_enabled=security_enabled, pdf_paths=pdf_paths)
+        # Write output
+        if args.output:
+            try:
+                output_file = Path(args.output)
+                if HAS_ORJSON:
+                    # orjson already produces UTF-8 bytes; skip the str round-trip
+                    output_file.write_bytes(orjson.dumps(build_json_report(reports), option=orjson.OPT_INDENT_2))
+                else:
+                    output_file.write_text(format_json_report(reports), encoding="utf-8")
+                print(f"Report written to: {output_file}", file=sys.stderr)
+            except Exception as e:
+                print(f"Error writing output file: {e}", file=sys.stderr)
+                return 1
+        else:
+            print(format_json_report(reports))
+        
+        return 0
     
-    # Write output
-    if args.output:
+    # CSV and text reports go straight to the destination instead of being built up in memory
+    try:
+        out_file = open(args.output, "w", newline="" if args.csv else None, encoding="utf-8") if args.output else sys.stdout
         try:
-            output_file = Path(args.output)
-            output_file.write_text(output_text, encoding="utf-8")
-            print(f"Report written to: {output_file}", file=sys.stderr)
-        except Exception as e:
-            print(f"Error writing output file: {e}", file=sys.stderr)
-            return 1
-    else:
-        print(output_text)
+            if args.csv:
+                risk_count = write_csv_report(out_file, reports, security_enabled=security_enabled, risks_only=args.security_risks_only, security_results=security_results)
+            else:
+                write_text_report(out_file, reports, security_enabled=security_enabled, security_results=security_results)
+        finally:
+            if args.output:
+                out_file.close()
+    except Exception as e:
+        print(f"Error writing output file: {e}", file=sys.stderr)
+        return 1
+    
+    # Log count if filtering for risks only
+    if args.csv and args.security_risks_only:
+        print(f"Found {risk_count} PDF(s) with significant security risks (beyond metadata only)", file=sys.stderr)
+    if args.output:
+        print(f"Report written to: {Path(args.output)}", file=sys.stderr)
     
     return 0
 
-
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Shared pikepdf action walker.
+
+Walks every page's annotation actions (/A) and additional actions (/AA) in a
+single pass so callers looking for different action kinds (JavaScript, URIs)
+do not each re-walk the page tree.
+"""
+
+from typing import Iterator, Tuple
+
+import pikepdf
+
+
+def walk_actions(pdf: pikepdf.Pdf) -> Iterator[Tuple[int, str, str, pikepdf.Dictionary]]:
+    """
+    Yield every page-level action in the document.
+    
+    Args:
+        pdf: Open pikepdf document
+    
+    Yields:
+        (page_num, source, action_subtype, action_dict) tuples, where page_num is
+        1-indexed, source is "annotation" or "page_action_<key>", and
+        action_subtype is the action's /S value as a string (e.g. "/JavaScript")
+    """
+    for page_num, page in enumerate(pdf.pages, 1):
+        annots = page.get('/Annots')
+        if annots is not None:
+            for annot in annots:
+                action = annot.get('/A')
+                if action is not None:
+                    yield page_num, 'annotation', str(action.get('/S')), action
+        
+        aa = page.get('/AA')
+        if aa is not None:
+            for key, action in aa.items():
+                yield page_num, f'page_action_{key}', str(action.get('/S')), action
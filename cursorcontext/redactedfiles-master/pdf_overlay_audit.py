@@ -11,11 +11,53 @@ but does NOT extract, display, or save any redacted content. All processing is d
 in-memory and no sensitive data is written to disk or console.
 """
 
+import os
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import fitz  # PyMuPDF
 
+# Optional: NumPy for batch overlap computation
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Optional: Numba for a compiled overlap loop (needs NumPy)
+try:
+    import numba
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
+# Black rects per overlap-matrix block when detect_overlaps() can stop early
+OVERLAP_BLOCK_ROWS = 64
+
+# Without NumPy, detect_overlaps() buckets text rects into a grid index instead
+# of testing every black/text pair once a page has at least this many of each
+GRID_INDEX_MIN_BLACK_RECTS = 16
+GRID_INDEX_MIN_TEXT_RECTS = 32
+
+# Side length of a grid index cell (points); roughly a few lines of body text
+GRID_CELL_SIZE = 32.0
+
+# Black rects whose coordinates all differ by less than this are duplicates (points)
+DEDUP_TOLERANCE = 0.5
+
+# Rectangle as plain (x0, y0, x1, y1) floats. The audit path passes these
+# instead of fitz.Rect, whose attribute and method calls cost far more than
+# tuple arithmetic; any 4-item x0/y0/x1/y1 sequence (fitz.Rect included) is
+# accepted wherever a RectT is expected.
+RectT = Tuple[float, float, float, float]
+
+# With audit_pdf(parallel=True), pages are split into this many contiguous
+# ranges per worker so uneven pages still balance across the pool
+PAGE_RANGES_PER_WORKER = 4
+
 
 @dataclass
 class PageRisk:
@@ -34,6 +76,7 @@ class PDFRiskReport:
     total_pages: int
     flagged_pages: List[PageRisk]
     error: Optional[str] = None
+    source_path: Optional[Path] = None  # Path the report was produced from
 
 
 def is_color_black(color: Optional[Tuple[float, ...]], threshold: float = 0.15) -> bool:
@@ -68,7 +111,7 @@ def is_color_black(color: Optional[Tuple[float, ...]], threshold: float = 0.15)
     return all(c <= threshold for c in color)
 
 
-def compute_overlap_area(rect1: fitz.Rect, rect2: fitz.Rect) -> float:
+def compute_overlap_area(rect1: RectT, rect2: RectT) -> float:
     """
     Compute the intersection area between two rectangles.
     
@@ -79,18 +122,187 @@ def compute_overlap_area(rect1: fitz.Rect, rect2: fitz.Rect) -> float:
     Returns:
         Area of intersection in square points
     """
-    intersection = rect1 & rect2  # fitz.Rect intersection operator
-    if intersection.is_empty or not intersection.is_valid:
+    # Plain coordinate arithmetic: cheaper than building an intersection Rect
+    ax0, ay0, ax1, ay1 = rect1
+    bx0, by0, bx1, by1 = rect2
+    width = min(ax1, bx1) - max(ax0, bx0)
+    if width <= 0:
+        return 0.0
+    height = min(ay1, by1) - max(ay0, by0)
+    if height <= 0:
         return 0.0
-    return intersection.get_area()
+    return width * height
+
+
+def compute_overlaps_np(black_rects: "np.ndarray", text_rects: "np.ndarray") -> "np.ndarray":
+    """
+    Compute all pairwise intersection areas between two sets of rectangles.
+    
+    Args:
+        black_rects: (N, 4) array of x0, y0, x1, y1
+        text_rects: (K, 4) array of x0, y0, x1, y1
+    
+    Returns:
+        (N, K) array of intersection areas in square points (0 where disjoint)
+    """
+    b = black_rects[:, None, :]
+    t = text_rects[None, :, :]
+    widths = np.minimum(b[..., 2], t[..., 2]) - np.maximum(b[..., 0], t[..., 0])
+    heights = np.minimum(b[..., 3], t[..., 3]) - np.maximum(b[..., 1], t[..., 1])
+    return np.clip(widths, 0, None) * np.clip(heights, 0, None)
+
+
+def build_text_grid(
+    text_rects: List[RectT],
+    cell_size: float = GRID_CELL_SIZE
+) -> Dict[Tuple[int, int], List[int]]:
+    """
+    Bucket text rectangles into a uniform grid for overlap candidate lookup.
+    
+    Args:
+        text_rects: List of text bounding boxes
+        cell_size: Side length of a grid cell (points)
+    
+    Returns:
+        Mapping of (column, row) cell to indices of the text rects touching it
+    """
+    grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for idx, (x0, y0, x1, y1) in enumerate(text_rects):
+        col0, col1 = int(x0 // cell_size), int(x1 // cell_size)
+        row0, row1 = int(y0 // cell_size), int(y1 // cell_size)
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                grid[(col, row)].append(idx)
+    return grid
+
+
+def query_text_grid(
+    grid: Dict[Tuple[int, int], List[int]],
+    rect: RectT,
+    cell_size: float = GRID_CELL_SIZE
+) -> List[int]:
+    """
+    Find the text rects that share a grid cell with a rectangle.
+    
+    Args:
+        grid: Index returned by build_text_grid()
+        rect: Rectangle to look up
+        cell_size: Cell size the grid was built with (points)
+    
+    Returns:
+        Sorted indices of candidate text rects (a superset of the overlapping ones)
+    """
+    x0, y0, x1, y1 = rect
+    candidates = set()
+    for col in range(int(x0 // cell_size), int(x1 // cell_size) + 1):
+        for row in range(int(y0 // cell_size), int(y1 // cell_size) + 1):
+            bucket = grid.get((col, row))
+            if bucket:
+                candidates.update(bucket)
+    return sorted(candidates)
+
+
+def build_text_bands(text_rects: List[RectT]) -> Tuple[List[RectT], List[float], float]:
+    """
+    Sort text rectangles by top edge for y-band candidate lookup.
+    
+    Args:
+        text_rects: List of text bounding boxes
+    
+    Returns:
+        (rects sorted by y0, their y0 values, tallest rect height)
+    """
+    ordered = sorted(text_rects, key=lambda r: r[1])
+    tops = [r[1] for r in ordered]
+    max_height = max((r[3] - r[1] for r in ordered), default=0.0)
+    return ordered, tops, max_height
+
+
+def query_text_bands(
+    bands: Tuple[List[RectT], List[float], float],
+    rect: RectT
+) -> List[RectT]:
+    """
+    Find the text rects whose vertical extent can overlap a rectangle's.
+    
+    Args:
+        bands: Index returned by build_text_bands()
+        rect: Rectangle to look up
+    
+    Returns:
+        Candidate text rects (a superset of those with a positive-area overlap)
+    """
+    ordered, tops, max_height = bands
+    # A span reaches below rect.y0 only if its top is within max_height above it
+    lo = bisect_right(tops, rect[1] - max_height)
+    hi = bisect_left(tops, rect[3])
+    return ordered[lo:hi]
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True, boundscheck=False)
+    def _overlap_count_kernel(black, text, min_overlap_area, stop_after):
+        """Compiled detect_overlaps() loop over (N, 4) / (K, 4) float64 arrays; stop_after < 0 disables the early exit."""
+        overlap_count = 0
+        for i in range(black.shape[0]):
+            bx0, by0, bx1, by1 = black[i, 0], black[i, 1], black[i, 2], black[i, 3]
+            for j in range(text.shape[0]):
+                width = min(bx1, text[j, 2]) - max(bx0, text[j, 0])
+                height = min(by1, text[j, 3]) - max(by0, text[j, 1])
+                area = width * height if width > 0.0 and height > 0.0 else 0.0
+                if area >= min_overlap_area:
+                    overlap_count += 1
+                    break  # Count each black rect only once
+            
+            # Early exit optimization
+            if stop_after >= 0 and overlap_count >= stop_after:
+                return overlap_count
+        return overlap_count
+
+
+def bounding_envelope(rects: List[RectT]) -> RectT:
+    """
+    Compute the smallest box enclosing a non-empty list of rectangles.
+    
+    Args:
+        rects: Rectangles to enclose
+    
+    Returns:
+        (x0, y0, x1, y1) of the enclosing box
+    """
+    return (
+        min(r[0] for r in rects),
+        min(r[1] for r in rects),
+        max(r[2] for r in rects),
+        max(r[3] for r in rects)
+    )
+
+
+def rects_touching_envelope(
+    rects: List[RectT],
+    envelope: RectT
+) -> List[RectT]:
+    """
+    Keep only rectangles whose interior intersects an envelope box.
+    
+    Args:
+        rects: Rectangles to filter
+        envelope: (x0, y0, x1, y1) box from bounding_envelope()
+    
+    Returns:
+        Rectangles that can have a positive-area overlap with the envelope
+    """
+    ex0, ey0, ex1, ey1 = envelope
+    return [r for r in rects if r[0] < ex1 and r[2] > ex0 and r[1] < ey1 and r[3] > ey0]
 
 
 def extract_black_rectangles(
     page: fitz.Page,
     black_threshold: float = 0.15,
     min_dimension: float = 2.0,
-    max_coverage_ratio: float = 0.95
-) -> List[fitz.Rect]:
+    max_coverage_ratio: float = 0.95,
+    page_area: Optional[float] = None
+) -> List[RectT]:
     """
     Extract filled black rectangles from a PDF page that could be redaction overlays.
     
@@ -99,66 +311,86 @@ def extract_black_rectangles(
         black_threshold: Maximum RGB component value to consider black (0.0-1.0)
         min_dimension: Minimum width/height to avoid thin lines (points)
         max_coverage_ratio: Ignore rects covering >95% of page (likely backgrounds)
+        page_area: Page area in square points, if the caller already knows it
+            (computed from page.rect only when the page has black fills)
     
     Returns:
-        List of black rectangle bounds
+        List of black rectangle bounds as (x0, y0, x1, y1) tuples
     """
-    black_rects: List[fitz.Rect] = []
-    page_area = page.rect.get_area()
+    black_rects: List[RectT] = []
+    
+    # A page with no content streams and no annotations (whose appearance
+    # streams get_cdrawings() also renders) cannot draw anything
+    if not page.get_contents() and not page.annot_xrefs():
+        return black_rects
     
     try:
-        drawings = page.get_drawings()
+        # get_cdrawings() is get_drawings() without converting every path's
+        # coordinates to Rect/Point/Quad objects; keep only black fills (not
+        # just strokes)
+        drawings = [
+            drawing for drawing in page.get_cdrawings()
+            if drawing.get("fill") and is_color_black(drawing["fill"], black_threshold)
+        ]
     except Exception:
         # Some PDFs may not support drawings extraction
         return black_rects
     
+    if not drawings:
+        return black_rects
+    
+    # Only needed for the coverage filter, so skipped on pages with no black fills
+    if page_area is None:
+        page_area = page.rect.get_area()
+    
     for drawing in drawings:
-        # Check if it has a fill color (not just stroke)
-        fill_color = drawing.get("fill")
-        if not fill_color:
-            continue
-        
-        # Check if fill is black
-        if not is_color_black(fill_color, black_threshold):
-            continue
-        
         # Candidate rects can come from drawing["rect"] OR from drawing["items"]
-        candidates: List[fitz.Rect] = []
+        candidates: List[RectT] = []
         
         # Check main rect
         rect = drawing.get("rect")
-        if isinstance(rect, fitz.Rect):
-            candidates.append(rect)
+        if rect is not None:
+            candidates.append(tuple(rect))
         
-        # Check items for rectangle paths (common form: ("re", Rect, ...))
+        # Check items for rectangle paths (form: ("re", rect, orientation)),
+        # normalized so x0 <= x1 and y0 <= y1
         for item in drawing.get("items", []) or []:
-            if len(item) >= 2 and isinstance(item[1], fitz.Rect):
-                candidates.append(item[1])
+            if item[0] == "re":
+                x0, y0, x1, y1 = item[1]
+                candidates.append((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
         
         # Process each candidate rectangle
         for rect in candidates:
-            # Filter out very thin lines
-            if rect.width < min_dimension or rect.height < min_dimension:
+            # Filter out very thin lines (negative extents count as zero)
+            width = max(0.0, rect[2] - rect[0])
+            height = max(0.0, rect[3] - rect[1])
+            if width < min_dimension or height < min_dimension:
                 continue
             
             # Filter out near-full-page fills (likely backgrounds, not redactions)
-            rect_area = rect.get_area()
+            rect_area = width * height
             if rect_area > 0 and (rect_area / page_area) > max_coverage_ratio:
                 continue
             
             black_rects.append(rect)
     
-    # De-duplicate near-identical rectangles
-    unique: List[fitz.Rect] = []
+    # De-duplicate near-identical rectangles. Kept rects are bucketed by x0 in
+    # tolerance-wide bins: a near-duplicate's x0 is always in the same or an
+    # adjacent bin, so only those buckets need the full comparison.
+    unique: List[RectT] = []
+    buckets: Dict[int, List[RectT]] = {}
     for r in black_rects:
-        if not any((abs(r.x0 - u.x0) < 0.5 and abs(r.y0 - u.y0) < 0.5 and
-                    abs(r.x1 - u.x1) < 0.5 and abs(r.y1 - u.y1) < 0.5) for u in unique):
+        key = int(r[0] // DEDUP_TOLERANCE)
+        if not any((abs(r[0] - u[0]) < DEDUP_TOLERANCE and abs(r[1] - u[1]) < DEDUP_TOLERANCE and
+                    abs(r[2] - u[2]) < DEDUP_TOLERANCE and abs(r[3] - u[3]) < DEDUP_TOLERANCE)
+                   for k in (key - 1, key, key + 1) for u in buckets.get(k, ())):
             unique.append(r)
+            buckets.setdefault(key, []).append(r)
     
     return unique
 
 
-def get_text_rectangles(page: fitz.Page) -> List[fitz.Rect]:
+def get_text_rectangles(page: fitz.Page) -> List[RectT]:
     """
     Extract text bounding boxes from a page WITHOUT extracting text content.
     Uses span-based extraction for better accuracy than word-based.
@@ -167,19 +399,21 @@ def get_text_rectangles(page: fitz.Page) -> List[fitz.Rect]:
         page: PyMuPDF page object
     
     Returns:
-        List of text bounding rectangles (no text content included)
+        List of text bounding rectangles as (x0, y0, x1, y1) tuples (no text
+        content included)
     
     SECURITY NOTE: This function extracts only geometric bounds, not text.
     Text content from spans is immediately discarded.
     """
-    text_rects: List[fitz.Rect] = []
+    text_rects: List[RectT] = []
     
     try:
-        # Use rawdict for more accurate span-based bounding boxes
-        # Spans are more reliable than words (handles ligatures, OCR issues)
-        raw_dict = page.get_text("rawdict")
+        # Span-based bounding boxes: spans are more reliable than words (handles
+        # ligatures, OCR issues). "dict" gives the same span bboxes as "rawdict"
+        # without building a per-character list for every glyph.
+        text_dict = page.get_text("dict")
         
-        for block in raw_dict.get("blocks", []):
+        for block in text_dict.get("blocks", []):
             # Type 0 = text block, Type 1 = image block
             if block.get("type") != 0:
                 continue
@@ -189,7 +423,7 @@ def get_text_rectangles(page: fitz.Page) -> List[fitz.Rect]:
                     bbox = span.get("bbox")
                     if bbox and len(bbox) == 4:
                         # Extract only coordinates, discard all text content
-                        text_rects.append(fitz.Rect(*bbox))
+                        text_rects.append(tuple(bbox))
     
     except Exception:
         # Handle cases where text extraction fails
@@ -199,8 +433,8 @@ def get_text_rectangles(page: fitz.Page) -> List[fitz.Rect]:
 
 
 def detect_overlaps(
-    black_rects: List[fitz.Rect],
-    text_rects: List[fitz.Rect],
+    black_rects: List[RectT],
+    text_rects: List[RectT],
     min_overlap_area: float = 4.0,
     stop_after: Optional[int] = None
 ) -> int:
@@ -208,19 +442,63 @@ def detect_overlaps(
     Count how many black rectangles overlap with text (per-black-rect metric).
     
     Args:
-        black_rects: List of black filled rectangles
-        text_rects: List of text bounding boxes
+        black_rects: List of black filled rectangles, or an (N, 4) x0/y0/x1/y1 array
+        text_rects: List of text bounding boxes, or a (K, 4) x0/y0/x1/y1 array
         min_overlap_area: Minimum intersection area to count as overlap (sq points)
         stop_after: Stop counting after this many overlaps (performance optimization)
     
     Returns:
         Count of black rects that overlap with at least one text rect
     """
+    if HAS_NUMPY and len(black_rects) and len(text_rects):
+        # No copy when the caller already passes float64 arrays
+        black = np.asarray(black_rects, dtype=np.float64)
+        text = np.asarray(text_rects, dtype=np.float64)
+        
+        if HAS_NUMBA:
+            # Compiled pairwise loop: breaks per black rect with no (N, K) temporaries
+            return int(_overlap_count_kernel(
+                black, text, float(min_overlap_area), -1 if stop_after is None else stop_after
+            ))
+        
+        # With a stop threshold, work through the black rects a block at a time
+        # so pages that reach it early skip the rest of the matrix
+        step = len(black) if stop_after is None else OVERLAP_BLOCK_ROWS
+        overlap_count = 0
+        for start in range(0, len(black), step):
+            areas = compute_overlaps_np(black[start:start + step], text)
+            # Count per black rect: any text rect over the threshold counts it once
+            overlap_count += int((areas >= min_overlap_area).any(axis=1).sum())
+            
+            # Early exit optimization
+            if stop_after is not None and overlap_count >= stop_after:
+                return stop_after
+        return overlap_count
+    
     overlap_count = 0
     
+    # Both indexes only return rects that can overlap with positive area; with
+    # min_overlap_area <= 0 even disjoint pairs count, so every pair is tested
+    grid = None
+    bands = None
+    if min_overlap_area > 0 and text_rects:
+        if (len(black_rects) >= GRID_INDEX_MIN_BLACK_RECTS and
+                len(text_rects) >= GRID_INDEX_MIN_TEXT_RECTS):
+            # Dense page: only test the text rects sharing a grid cell with each black rect
+            grid = build_text_grid(text_rects)
+        else:
+            # Otherwise only test the text lines level with each black rect
+            bands = build_text_bands(text_rects)
+    
     # Count per black rect (more interpretable risk metric)
     for black_rect in black_rects:
-        for text_rect in text_rects:
+        if grid is not None:
+            candidates = [text_rects[idx] for idx in query_text_grid(grid, black_rect)]
+        elif bands is not None:
+            candidates = query_text_bands(bands, black_rect)
+        else:
+            candidates = text_rects
+        for text_rect in candidates:
             if compute_overlap_area(black_rect, text_rect) >= min_overlap_area:
                 overlap_count += 1
                 break  # Count each black rect only once
@@ -258,14 +536,28 @@ def audit_page(
     if not black_rects:
         return None  # No potential redaction boxes found
     
+    # Each black rect adds at most one overlap, so with fewer rects than min_hits
+    # the page cannot be flagged; skip the costly text extraction
+    if len(black_rects) < min_hits:
+        return None
+    
     # Extract text bounds (no content)
     text_rects = get_text_rectangles(page)
     
     if not text_rects:
         return None  # No text to overlap with
     
+    # Black rects outside the text envelope (e.g. in margins) cannot overlap any
+    # span, and vice versa, so drop both before the pairwise scan. Touching rects
+    # have zero area and only count when min_overlap_area allows it.
+    overlap_black, overlap_text = black_rects, text_rects
+    if min_overlap_area > 0:
+        overlap_black = rects_touching_envelope(black_rects, bounding_envelope(text_rects))
+        if overlap_black:
+            overlap_text = rects_touching_envelope(text_rects, bounding_envelope(overlap_black))
+    
     # Detect overlaps with early exit optimization
-    overlap_count = detect_overlaps(black_rects, text_rects, min_overlap_area, stop_after=min_hits)
+    overlap_count = detect_overlaps(overlap_black, overlap_text, min_overlap_area, stop_after=min_hits)
     
     # Calculate confidence score
     score = 0
@@ -275,7 +567,7 @@ def audit_page(
         score += 3  # Overlaps detected
     
     # Check for redaction-like rectangles (wide and short)
-    redaction_like = sum(1 for r in black_rects if r.width > r.height * 3)
+    redaction_like = sum(1 for x0, y0, x1, y1 in black_rects if x1 - x0 > (y1 - y0) * 3)
     if redaction_like > 0:
         score += 1
     
@@ -295,11 +587,56 @@ def audit_page(
     return None
 
 
+def _audit_page_range(
+    doc: fitz.Document,
+    start: int,
+    stop: int,
+    black_threshold: float,
+    min_overlap_area: float,
+    min_hits: int
+) -> List[PageRisk]:
+    """Audit pages [start, stop) of an open document, returning flagged pages in order."""
+    flagged_pages = []
+    
+    for page_idx in range(start, stop):
+        page = doc[page_idx]
+        page_num = page_idx + 1  # 1-indexed for user display
+        
+        risk = audit_page(
+            page,
+            page_num,
+            black_threshold,
+            min_overlap_area,
+            min_hits
+        )
+        
+        if risk:
+            flagged_pages.append(risk)
+    
+    return flagged_pages
+
+
+def _audit_page_range_worker(
+    pdf_path: Path,
+    start: int,
+    stop: int,
+    black_threshold: float,
+    min_overlap_area: float,
+    min_hits: int
+) -> List[PageRisk]:
+    """Pool worker: open the PDF in this process and audit one page range."""
+    with fitz.open(str(pdf_path)) as doc:
+        if doc.is_encrypted:
+            doc.authenticate("")
+        return _audit_page_range(doc, start, stop, black_threshold, min_overlap_area, min_hits)
+
+
 def audit_pdf(
     pdf_path: Path,
     black_threshold: float = 0.15,
     min_overlap_area: float = 4.0,
-    min_hits: int = 1
+    min_hits: int = 1,
+    parallel: bool = False
 ) -> PDFRiskReport:
     """
     Audit an entire PDF file for overlay redaction risks.
@@ -309,6 +646,8 @@ def audit_pdf(
         black_threshold: Color threshold for black detection (0.0-1.0)
         min_overlap_area: Minimum overlap area to count (sq points)
         min_hits: Minimum overlaps to flag a page
+        parallel: Audit page ranges in worker processes (for large single PDFs;
+            leave off when already auditing many files in parallel)
     
     Returns:
         PDFRiskReport with findings
@@ -329,25 +668,34 @@ def audit_pdf(
                 filename=pdf_path.name,
                 total_pages=0,
                 flagged_pages=[],
-                error=error
+                error=error,
+                source_path=pdf_path
             )
         
-        for page_idx in range(total_pages):
-            page = doc[page_idx]
-            page_num = page_idx + 1  # 1-indexed for user display
-            
-            risk = audit_page(
-                page,
-                page_num,
-                black_threshold,
-                min_overlap_area,
-                min_hits
+        workers = min(os.cpu_count() or 1, total_pages)
+        if parallel and workers > 1:
+            # fitz.Document cannot be pickled: each worker reopens the file by path
+            doc.close()
+            range_count = min(total_pages, workers * PAGE_RANGES_PER_WORKER)
+            bounds = [total_pages * i // range_count for i in range(range_count + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    _audit_page_range_worker,
+                    [pdf_path] * range_count,
+                    bounds[:-1],
+                    bounds[1:],
+                    [black_threshold] * range_count,
+                    [min_overlap_area] * range_count,
+                    [min_hits] * range_count
+                )
+                # map() yields in submission order, so pages stay 1-indexed ascending
+                for range_pages in results:
+                    flagged_pages.extend(range_pages)
+        else:
+            flagged_pages = _audit_page_range(
+                doc, 0, total_pages, black_threshold, min_overlap_area, min_hits
             )
-            
-            if risk:
-                flagged_pages.append(risk)
-        
-        doc.close()
+            doc.close()
     
     except FileNotFoundError:
         error = f"File not found: {pdf_path}"
@@ -362,7 +710,8 @@ def audit_pdf(
         filename=pdf_path.name,
         total_pages=total_pages,
         flagged_pages=flagged_pages,
-        error=error
+        error=error,
+        source_path=pdf_path
     )
 
 
@@ -396,6 +745,8 @@ def audit_directory(
     try:
         pdf_files = sorted(dir_path.glob(pattern))
         
+        # Serial on purpose: overlay_checker.audit_pdfs() owns the file-level
+        # process pool, and audit_pdf(parallel=True) splits a single file
         for pdf_file in pdf_files:
             if pdf_file.is_file():
                 report = audit_pdf(pdf_file, **audit_kwargs)
@@ -16,6 +16,7 @@ sensitive content. It detects potential privacy/security issues like:
 All checks are non-extractive - we report presence and counts only, not content.
 """
 
+import mmap
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List
@@ -28,6 +29,21 @@ try:
 except ImportError:
     HAS_PIKEPDF = False
 
+# A linearized file's /Linearized dictionary sits within its first 1024 bytes,
+# and its first-page cross-reference section adds one startxref that is not a
+# revision
+LINEARIZED_HEADER_BYTES = 1024
+
+# Keys of doc.metadata, in PyMuPDF's order
+_META_KEYS = (
+    'format', 'title', 'author', 'subject', 'keywords', 'creator',
+    'producer', 'creationDate', 'modDate', 'trapped', 'encryption'
+)
+
+# Page annotation types that page.annots() never yields (widgets are counted
+# separately as form fields)
+SKIPPED_ANNOT_TYPES = (fitz.PDF_ANNOT_LINK, fitz.PDF_ANNOT_WIDGET, fitz.PDF_ANNOT_POPUP)
+
 
 @dataclass
 class SecurityFindings:
@@ -62,7 +78,7 @@ def check_metadata(doc: fitz.Document) -> tuple[bool, List[str]]:
             return False, []
         
         # Collect non-empty keys
-        keys = [k for k, v in metadata.items() if v]
+        keys = [k for k in _META_KEYS if metadata.get(k)]
         return len(keys) > 0, keys
     except Exception:
         return False, []
@@ -93,10 +109,14 @@ def check_annotations(doc: fitz.Document) -> tuple[bool, int]:
     """
     try:
         total_count = 0
-        for page in doc:
+        # page_annot_xrefs() reads each page's /Annots array directly, without
+        # loading the page or building an Annot object per annotation
+        for page_idx in range(doc.page_count):
             try:
-                annots = list(page.annots())
-                total_count += len(annots)
+                total_count += sum(
+                    1 for _, annot_type, _ in doc.page_annot_xrefs(page_idx)
+                    if annot_type not in SKIPPED_ANNOT_TYPES
+                )
             except Exception:
                 continue
         
@@ -113,12 +133,18 @@ def check_forms(doc: fitz.Document) -> tuple[bool, int]:
         (has_forms, field_count)
     """
     try:
+        # No AcroForm /Fields array (or an empty one): nothing to count, so
+        # skip the page walk
+        if not doc.is_form_pdf:
+            return False, 0
+        
         total_count = 0
-        for page in doc:
+        for page_idx in range(doc.page_count):
             try:
-                widgets = page.widgets()
-                if widgets:
-                    total_count += len(widgets)
+                total_count += sum(
+                    1 for _, annot_type, _ in doc.page_annot_xrefs(page_idx)
+                    if annot_type == fitz.PDF_ANNOT_WIDGET
+                )
             except Exception:
                 continue
         
@@ -127,6 +153,64 @@ def check_forms(doc: fitz.Document) -> tuple[bool, int]:
         return False, 0
 
 
+def _layers_from_open(pdf: "pikepdf.Pdf") -> tuple[bool, int]:
+    """check_layers_pikepdf() on an already-open pikepdf document."""
+    try:
+        catalog = pdf.Root
+        
+        # Check for /OCProperties
+        if '/OCProperties' in catalog:
+            ocprops = catalog['/OCProperties']
+            
+            # Check for /OCGs array
+            if '/OCGs' in ocprops:
+                ocgs = ocprops['/OCGs']
+                if hasattr(ocgs, '__len__'):
+                    return True, len(ocgs)
+                return True, 1
+        
+        return False, 0
+    except Exception:
+        return False, 0
+
+
+def _javascript_actions_from_open(pdf: "pikepdf.Pdf") -> tuple[bool, bool]:
+    """check_javascript_actions_pikepdf() on an already-open pikepdf document."""
+    try:
+        catalog = pdf.Root
+        has_js = False
+        has_actions = False
+        
+        # Check for /Names /JavaScript
+        if '/Names' in catalog:
+            names = catalog['/Names']
+            if '/JavaScript' in names:
+                has_js = True
+        
+        # Check for /OpenAction
+        if '/OpenAction' in catalog:
+            has_actions = True
+        
+        # Check for /AA (Additional Actions)
+        if '/AA' in catalog:
+            has_actions = True
+        
+        return has_js, has_actions
+    except Exception:
+        return False, False
+
+
+def _thumbnails_from_open(pdf: "pikepdf.Pdf") -> bool:
+    """check_thumbnails_pikepdf() on an already-open pikepdf document."""
+    try:
+        for page in pdf.pages:
+            if '/Thumb' in page:
+                return True
+        return False
+    except Exception:
+        return False
+
+
 def check_layers_pikepdf(pdf_path: Path) -> tuple[bool, int]:
     """
     Check for Optional Content Groups (layers) using pikepdf.
@@ -139,20 +223,7 @@ def check_layers_pikepdf(pdf_path: Path) -> tuple[bool, int]:
     
     try:
         with pikepdf.open(pdf_path) as pdf:
-            catalog = pdf.Root
-            
-            # Check for /OCProperties
-            if '/OCProperties' in catalog:
-                ocprops = catalog['/OCProperties']
-                
-                # Check for /OCGs array
-                if '/OCGs' in ocprops:
-                    ocgs = ocprops['/OCGs']
-                    if hasattr(ocgs, '__len__'):
-                        return True, len(ocgs)
-                    return True, 1
-            
-            return False, 0
+            return _layers_from_open(pdf)
     except Exception:
         return False, 0
 
@@ -169,25 +240,7 @@ def check_javascript_actions_pikepdf(pdf_path: Path) -> tuple[bool, bool]:
     
     try:
         with pikepdf.open(pdf_path) as pdf:
-            catalog = pdf.Root
-            has_js = False
-            has_actions = False
-            
-            # Check for /Names /JavaScript
-            if '/Names' in catalog:
-                names = catalog['/Names']
-                if '/JavaScript' in names:
-                    has_js = True
-            
-            # Check for /OpenAction
-            if '/OpenAction' in catalog:
-                has_actions = True
-            
-            # Check for /AA (Additional Actions)
-            if '/AA' in catalog:
-                has_actions = True
-            
-            return has_js, has_actions
+            return _javascript_actions_from_open(pdf)
     except Exception:
         return False, False
 
@@ -204,10 +257,7 @@ def check_thumbnails_pikepdf(pdf_path: Path) -> bool:
     
     try:
         with pikepdf.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                if '/Thumb' in page:
-                    return True
-            return False
+            return _thumbnails_from_open(pdf)
     except Exception:
         return False
 
@@ -220,21 +270,22 @@ def check_incremental_updates(pdf_path: Path) -> bool:
         incremental_updates_suspected
     """
     try:
-        # Read last 65KB of file (where xref tables typically are)
+        # Memory-map the whole file: the OS pages it in and find() scans it
+        # in C, so earlier revisions are seen without reading it into memory
         with open(pdf_path, 'rb') as f:
-            f.seek(0, 2)  # Seek to end
-            size = f.tell()
-            
-            # Read last chunk
-            chunk_size = min(65536, size)
-            f.seek(max(0, size - chunk_size))
-            data = f.read()
-        
-        # Count startxref occurrences
-        count = data.count(b'startxref')
-        
-        # More than one startxref suggests incremental updates
-        return count > 1
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # More than one startxref (beyond a linearized file's extra
+                # one) suggests incremental updates; stop once that many are seen
+                needed = 2
+                if mm.find(b'/Linearized', 0, LINEARIZED_HEADER_BYTES) != -1:
+                    needed += 1
+                
+                pos = -1
+                for _ in range(needed):
+                    pos = mm.find(b'startxref', pos + 1)
+                    if pos == -1:
+                        return False
+                return True
     except Exception:
         return False
 
@@ -274,9 +325,15 @@ def audit_pdf_security(pdf_path: Path) -> SecurityFindings:
         
         # Pikepdf checks (if available)
         if HAS_PIKEPDF:
-            findings.has_layers, findings.layer_count = check_layers_pikepdf(pdf_path)
-            findings.has_javascript, findings.has_actions = check_javascript_actions_pikepdf(pdf_path)
-            findings.has_thumbnails = check_thumbnails_pikepdf(pdf_path)
+            # Parse the file once and share it across the pikepdf checks; if
+            # pikepdf cannot open it, they keep their negative defaults
+            try:
+                with pikepdf.open(pdf_path) as pdf:
+                    findings.has_layers, findings.layer_count = _layers_from_open(pdf)
+                    findings.has_javascript, findings.has_actions = _javascript_actions_from_open(pdf)
+                    findings.has_thumbnails = _thumbnails_from_open(pdf)
+            except Exception:
+                pass
         else:
             findings.notes.append("pikepdf not available - some checks skipped")
         
@@ -43,12 +43,16 @@ def remove_overlay_redactions(pdf_path: Path, output_dir: Path) -> bool:
                             if rect:
                                 rects_to_remove.append(fitz.Rect(rect))
             
-            # Remove the black rectangles by drawing white rectangles over them
+            # Cover the black rectangles with white ones, batched into a single
+            # shape so each page gets one content addition instead of one per rect.
+            # Nothing beneath the boxes is deleted.
             if rects_to_remove:
                 modified = True
+                shape = page.new_shape()
                 for rect in rects_to_remove:
-                    # Draw white rectangle to cover the black one
-                    page.draw_rect(rect, color=(1, 1, 1), fill=(1, 1, 1))
+                    shape.draw_rect(rect)
+                shape.finish(color=(1, 1, 1), fill=(1, 1, 1))
+                shape.commit()
         
         if modified:
             # Save the cleaned PDF
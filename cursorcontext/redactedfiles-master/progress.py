@@ -0,0 +1,37 @@
+"""
+Progress reporting for the batch extraction scripts.
+
+Re-exports tqdm when it is installed. Without it, a minimal stand-in
+prints an "i/total" line every PROGRESS_PRINT_EVERY items so long runs
+still report progress.
+"""
+
+# Items between progress lines when tqdm is not installed
+PROGRESS_PRINT_EVERY = 25
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    def tqdm(iterable, total=None, unit='it', **kwargs):
+        """
+        Yield items from iterable, printing periodic progress lines.
+        
+        Args:
+            iterable: Items to iterate over
+            total: Item count; taken from len(iterable) when omitted
+            unit: Label printed after the counts
+        """
+        if total is None and hasattr(iterable, '__len__'):
+            total = len(iterable)
+        total_str = '?' if total is None else total
+        
+        done = 0
+        for done, item in enumerate(iterable, 1):
+            yield item
+            if done % PROGRESS_PRINT_EVERY == 0:
+                print(f"[{done}/{total_str}] {unit}", flush=True)
+        
+        if done % PROGRESS_PRINT_EVERY:
+            print(f"[{done}/{total_str}] {unit}", flush=True)
+    
+    tqdm.write = print
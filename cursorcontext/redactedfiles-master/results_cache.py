@@ -0,0 +1,61 @@
+"""
+Persistent per-file results cache for the batch extraction scripts.
+
+Entries are keyed by filename and validated against the file's
+(st_mtime_ns, st_size), so unchanged PDFs are not re-parsed on later runs.
+The whole cache is discarded when the owning script bumps its version.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class ResultsCache:
+    """JSON side-cache mapping filename -> (file key, extraction result)."""
+    
+    def __init__(self, cache_path: Path, version: int):
+        """
+        Load an existing cache file, ignoring it if missing, corrupt, or stale.
+        
+        Args:
+            cache_path: Location of the JSON cache file
+            version: Extraction code version; a mismatch invalidates all entries
+        """
+        self.cache_path = Path(cache_path)
+        self.version = version
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+            if data.get('version') == version:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+    
+    @staticmethod
+    def file_key(path) -> List[int]:
+        """Return the [mtime_ns, size] key for a file (raises OSError if missing)."""
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    
+    def get(self, filename: str, key: List[int]) -> Optional[Any]:
+        """Return the cached result for filename if its file key still matches."""
+        entry = self.entries.get(filename)
+        if entry is not None and entry.get('key') == key:
+            return entry.get('result')
+        return None
+    
+    def put(self, filename: str, key: List[int], result: Any) -> None:
+        """Store a JSON-serializable result for filename."""
+        self.entries[filename] = {'key': key, 'result': result}
+    
+    def save(self) -> None:
+        """Write the cache atomically next to its final location."""
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        tmp_path.write_text(
+            json.dumps({'version': self.version, 'entries': self.entries}),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, self.cache_path)
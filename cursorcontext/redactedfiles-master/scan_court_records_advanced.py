@@ -7,9 +7,70 @@ import os
 import sys
 from pathlib import Path
 import csv
+import heapq
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pdf_security_audit_advanced import audit_pdf_advanced
 
+# Files are audited in parallel on up to this many worker processes
+MAX_WORKERS = 6
+
+# Workers are replaced after this many files to bound PyMuPDF memory growth
+# (needs Python 3.11+; older versions keep each worker for the whole scan)
+TASKS_PER_WORKER = 50
+
+# Large write buffer so streamed result rows go out in few syscalls
+CSV_BUFFER_SIZE = 1 << 20
+
+# Number of highest-risk files listed in the final summary
+TOP_RISK_COUNT = 10
+
+# Output columns, in order; error rows leave risk_level blank
+CSV_FIELDNAMES = (
+    'filename',
+    'risk_score',
+    'risk_level',
+    'has_metadata',
+    'metadata_count',
+    'metadata_keys',
+    'has_hidden_text',
+    'hidden_text_types',
+    'white_on_white_pages',
+    'offpage_text_pages',
+    'overlay_risk',
+    'has_attachments',
+    'attachment_count',
+    'attachment_names',
+    'has_annotations',
+    'annotation_count',
+    'annotation_types',
+    'has_forms',
+    'form_field_count',
+    'reviewer_names',
+    'has_ocr_layer',
+    'is_scanned',
+    'ocr_pages_count',
+    'has_javascript',
+    'javascript_count',
+    'has_external_links',
+    'external_url_count',
+    'external_urls',
+    'has_remote_resources',
+    'has_signatures',
+    'signature_count',
+    'signer_names',
+    'has_layers',
+    'layer_count',
+    'incremental_updates',
+    'version_count',
+    'has_structure_tags',
+    'has_alt_text',
+    'has_watermarks',
+    'has_actions',
+    'has_thumbnails',
+    'notes',
+)
+
 # ANSI Color Codes
 class Color:
     RESET = '\033[0m'
@@ -68,7 +129,7 @@ def scan_directory(pdf_dir: str, output_csv: str):
     print(f"{Color.BLUE}[>]{Color.RESET} INITIATING DEEP SCAN...\n")
     print(f"{Color.GRAY}" + "─"*80 + Color.RESET)
     
-    results = []
+    top_risk = []  # Min-heap of (risk_score, -index, filename, risk_level)
     stats = {
         'total': total,
         'high_risk': 0,
@@ -89,200 +150,219 @@ def scan_directory(pdf_dir: str, output_csv: str):
     
     start_time = time.time()
     
-    for i, pdf_path in enumerate(pdf_files, 1):
-        filename = pdf_path.name
-        
-        # Progress bar
-        pct = (i / total) * 100
-        bar_len = 40
-        filled = int(bar_len * i / total)
-        bar = f"{Color.GREEN}{'█' * filled}{Color.GRAY}{'░' * (bar_len - filled)}{Color.RESET}"
-        
-        # Calculate speed and ETA
-        elapsed = time.time() - start_time
-        if i > 1:
-            speed = i / elapsed
-            eta = (total - i) / speed
-            eta_str = f"{int(eta//60)}m{int(eta%60):02d}s"
-        else:
-            speed = 0
-            eta_str = "calculating..."
+    pool_kwargs = {'max_workers': min(os.cpu_count() or 1, MAX_WORKERS)}
+    if sys.version_info >= (3, 11):
+        pool_kwargs['max_tasks_per_child'] = TASKS_PER_WORKER
+    
+    # Rows are written as each file completes rather than buffered until the end.
+    # Each file is audited independently in a worker; progress, stats and
+    # results are all updated here in the parent as files complete
+    with (
+        open(output_csv, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as out_f,
+        ProcessPoolExecutor(**pool_kwargs) as executor,
+    ):
+        writer = csv.DictWriter(out_f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
         
-        # Print progress line with colors
-        print(f"\r[{bar}] {Color.CYAN}{pct:5.1f}%{Color.RESET} | {Color.WHITE}{i:4d}/{total}{Color.RESET} | {Color.MAGENTA}{speed:.1f} doc/s{Color.RESET} | ETA: {Color.YELLOW}{eta_str}{Color.RESET} | {Color.RED}H:{stats['high_risk']}{Color.RESET} {Color.YELLOW}M:{stats['medium_risk']}{Color.RESET} {Color.GREEN}L:{stats['low_risk']}{Color.RESET}", end='', flush=True)
+        futures = {executor.submit(audit_pdf_advanced, str(pdf_path)): pdf_path for pdf_path in pdf_files}
         
         try:
-            # Run advanced security audit
-            findings = audit_pdf_advanced(str(pdf_path))
-            
-            # Calculate risk level from score
-            if findings.risk_score >= 40:
-                risk_level = 'HIGH'
-                stats['high_risk'] += 1
-            elif findings.risk_score >= 20:
-                risk_level = 'MEDIUM'
-                stats['medium_risk'] += 1
-            else:
-                risk_level = 'LOW'
-                stats['low_risk'] += 1
-            
-            if findings.has_metadata:
-                stats['metadata'] += 1
-            if findings.has_hidden_text:
-                stats['hidden_text'] += 1
-            if findings.has_attachments:
-                stats['attachments'] += 1
-            if findings.has_annotations:
-                stats['annotations'] += 1
-            if findings.has_forms:
-                stats['forms'] += 1
-            if findings.has_ocr_layer:
-                stats['ocr'] += 1
-            if findings.has_javascript:
-                stats['javascript'] += 1
-            if findings.has_external_links:
-                stats['links'] += 1
-            if findings.has_signatures:
-                stats['signatures'] += 1
-            if findings.incremental_updates:
-                stats['incremental'] += 1
-            
-            # Log findings for this file with colors
-            findings_list = []
-            if findings.has_metadata: findings_list.append(f"{Color.BLUE}Meta:{len(findings.metadata_keys)}{Color.RESET}")
-            if findings.has_hidden_text: findings_list.append(f"{Color.RED}Hidden:{','.join(findings.hidden_text_types)}{Color.RESET}")
-            if findings.has_javascript: findings_list.append(f"{Color.MAGENTA}JS:{findings.javascript_count}{Color.RESET}")
-            if findings.has_signatures: findings_list.append(f"{Color.YELLOW}Sig:{findings.signature_count}{Color.RESET}")
-            if findings.has_external_links: findings_list.append(f"{Color.CYAN}URLs:{len(findings.external_urls)}{Color.RESET}")
-            if findings.has_attachments: findings_list.append(f"{Color.GREEN}Attach:{findings.attachment_count}{Color.RESET}")
-            if findings.has_annotations: findings_list.append(f"{Color.GRAY}Anno:{findings.annotation_count}{Color.RESET}")
-            if findings.has_forms: findings_list.append(f"{Color.WHITE}Forms:{findings.form_field_count}{Color.RESET}")
-            if findings.incremental_updates: findings_list.append(f"{Color.DIM}Incr:{findings.version_count}{Color.RESET}")
-            
-            # Print detailed log for non-LOW risk files or files with interesting findings
-            if risk_level != 'LOW' or findings_list:
-                print(f"\r{'':120}\r", end='')  # Clear line
-                findings_str = ' | '.join(findings_list) if findings_list else f'{Color.GREEN}clean{Color.RESET}'
+            for i, future in enumerate(as_completed(futures), 1):
+                filename = futures[future].name
                 
-                # Color code risk level
-                if risk_level == 'HIGH':
-                    risk_color = f"{Color.RED}{Color.BOLD}{risk_level}{Color.RESET}"
-                elif risk_level == 'MEDIUM':
-                    risk_color = f"{Color.YELLOW}{risk_level}{Color.RESET}"
+                # Progress bar
+                pct = (i / total) * 100
+                bar_len = 40
+                filled = int(bar_len * i / total)
+                bar = f"{Color.GREEN}{'█' * filled}{Color.GRAY}{'░' * (bar_len - filled)}{Color.RESET}"
+                
+                # Calculate speed and ETA
+                elapsed = time.time() - start_time
+                if i > 1:
+                    speed = i / elapsed
+                    eta = (total - i) / speed
+                    eta_str = f"{int(eta//60)}m{int(eta%60):02d}s"
                 else:
-                    risk_color = f"{Color.GREEN}{risk_level}{Color.RESET}"
+                    speed = 0
+                    eta_str = "calculating..."
                 
-                print(f"{Color.GRAY}[{i:4d}]{Color.RESET} {risk_color:6s} {Color.DIM}({findings.risk_score:3.0f}){Color.RESET} | {Color.WHITE}{filename[:45]:<45s}{Color.RESET} | {findings_str}")
-                print(f"[{bar}] {Color.CYAN}{pct:5.1f}%{Color.RESET} | {Color.WHITE}{i:4d}/{total}{Color.RESET} | {Color.MAGENTA}{speed:.1f} doc/s{Color.RESET} | ETA: {Color.YELLOW}{eta_str}{Color.RESET} | {Color.RED}H:{stats['high_risk']}{Color.RESET} {Color.YELLOW}M:{stats['medium_risk']}{Color.RESET} {Color.GREEN}L:{stats['low_risk']}{Color.RESET}", end='', flush=True)
-            
-            # Store result
-            results.append({
-                'filename': filename,
-                'risk_score': findings.risk_score,
-                'risk_level': risk_level,
-                'has_metadata': 'YES' if findings.has_metadata else 'NO',
-                'metadata_count': len(findings.metadata_keys),
-                'metadata_keys': ', '.join(findings.metadata_keys) if findings.metadata_keys else '',
-                'has_hidden_text': 'YES' if findings.has_hidden_text else 'NO',
-                'hidden_text_types': ', '.join(findings.hidden_text_types) if findings.hidden_text_types else '',
-                'white_on_white_pages': ', '.join(map(str, findings.white_on_white_pages)) if findings.white_on_white_pages else '',
-                'offpage_text_pages': ', '.join(map(str, findings.offpage_text_pages)) if findings.offpage_text_pages else '',
-                'overlay_risk': findings.overlay_risk,
-                'has_attachments': 'YES' if findings.has_attachments else 'NO',
-                'attachment_count': findings.attachment_count,
-                'attachment_names': ', '.join(findings.attachment_names) if findings.attachment_names else '',
-                'has_annotations': 'YES' if findings.has_annotations else 'NO',
-                'annotation_count': findings.annotation_count,
-                'annotation_types': ', '.join(findings.annotation_types) if findings.annotation_types else '',
-                'has_forms': 'YES' if findings.has_forms else 'NO',
-                'form_field_count': findings.form_field_count,
-                'reviewer_names': ', '.join(findings.reviewer_names) if findings.reviewer_names else '',
-                'has_ocr_layer': 'YES' if findings.has_ocr_layer else 'NO',
-                'is_scanned': 'YES' if findings.is_scanned else 'NO',
-                'ocr_pages_count': len(findings.ocr_pages),
-                'has_javascript': 'YES' if findings.has_javascript else 'NO',
-                'javascript_count': findings.javascript_count,
-                'has_external_links': 'YES' if findings.has_external_links else 'NO',
-                'external_url_count': len(findings.external_urls),
-                'external_urls': ', '.join(findings.external_urls[:5]) if findings.external_urls else '',
-                'has_remote_resources': 'YES' if findings.has_remote_resources else 'NO',
-                'has_signatures': 'YES' if findings.has_signatures else 'NO',
-                'signature_count': findings.signature_count,
-                'signer_names': ', '.join(findings.signer_names) if findings.signer_names else '',
-                'has_layers': 'YES' if findings.has_layers else 'NO',
-                'layer_count': findings.layer_count,
-                'incremental_updates': 'YES' if findings.incremental_updates else 'NO',
-                'version_count': findings.version_count,
-                'has_structure_tags': 'YES' if findings.has_structure_tags else 'NO',
-                'has_alt_text': 'YES' if findings.has_alt_text else 'NO',
-                'has_watermarks': 'YES' if findings.has_watermarks else 'NO',
-                'has_actions': 'YES' if findings.has_actions else 'NO',
-                'has_thumbnails': 'YES' if findings.has_thumbnails else 'NO',
-                'notes': '; '.join(findings.notes) if findings.notes else ''
-            })
-            
-        except Exception as e:
-            stats['errors'] += 1
-            # Clear progress line and show detailed error
-            print(f"\r{'':120}\r", end='')  # Clear line
-            print(f"{Color.GRAY}[{i:4d}]{Color.RESET} {Color.RED}{Color.BOLD}⚠️  ERROR{Color.RESET} | {Color.WHITE}{filename[:45]:<45s}{Color.RESET} | {Color.RED}{type(e).__name__}{Color.RESET}: {Color.GRAY}{str(e)[:60]}{Color.RESET}")
-            print(f"[{bar}] {Color.CYAN}{pct:5.1f}%{Color.RESET} | {Color.WHITE}{i:4d}/{total}{Color.RESET} | {Color.MAGENTA}{speed:.1f} doc/s{Color.RESET} | ETA: {Color.YELLOW}{eta_str}{Color.RESET} | {Color.RED}H:{stats['high_risk']}{Color.RESET} {Color.YELLOW}M:{stats['medium_risk']}{Color.RESET} {Color.GREEN}L:{stats['low_risk']}{Color.RESET}", end='', flush=True)
-            results.append({
-                'filename': filename,
-                'risk_score': 0,
-                'has_metadata': 'NO',
-                'metadata_count': 0,
-                'metadata_keys': '',
-                'has_hidden_text': 'NO',
-                'hidden_text_types': '',
-                'white_on_white_pages': '',
-                'offpage_text_pages': '',
-                'overlay_risk': 'ERROR',
-                'has_attachments': 'NO',
-                'attachment_count': 0,
-                'attachment_names': '',
-                'has_annotations': 'NO',
-                'annotation_count': 0,
-                'annotation_types': '',
-                'has_forms': 'NO',
-                'form_field_count': 0,
-                'reviewer_names': '',
-                'has_ocr_layer': 'NO',
-                'is_scanned': 'NO',
-                'ocr_pages_count': 0,
-                'has_javascript': 'NO',
-                'javascript_count': 0,
-                'has_external_links': 'NO',
-                'external_url_count': 0,
-                'external_urls': '',
-                'has_remote_resources': 'NO',
-                'has_signatures': 'NO',
-                'signature_count': 0,
-                'signer_names': '',
-                'has_layers': 'NO',
-                'layer_count': 0,
-                'incremental_updates': 'NO',
-                'version_count': 0,
-                'has_structure_tags': 'NO',
-                'has_alt_text': 'NO',
-                'has_watermarks': 'NO',
-                'has_actions': 'NO',
-                'has_thumbnails': 'NO',
-                'notes': f'ERROR: {str(e)}'
-            })
+                # Print progress line with colors
+                print(f"\r[{bar}] {Color.CYAN}{pct:5.1f}%{Color.RESET} | {Color.WHITE}{i:4d}/{total}{Color.RESET} | {Color.MAGENTA}{speed:.1f} doc/s{Color.RESET} | ETA: {Color.YELLOW}{eta_str}{Color.RESET} | {Color.RED}H:{stats['high_risk']}{Color.RESET} {Color.YELLOW}M:{stats['medium_risk']}{Color.RESET} {Color.GREEN}L:{stats['low_risk']}{Color.RESET}", end='', flush=True)
+                
+                try:
+                    # Advanced security audit result (re-raises the worker's exception)
+                    findings = future.result()
+                    
+                    # Calculate risk level from score
+                    if findings.risk_score >= 40:
+                        risk_level = 'HIGH'
+                        stats['high_risk'] += 1
+                    elif findings.risk_score >= 20:
+                        risk_level = 'MEDIUM'
+                        stats['medium_risk'] += 1
+                    else:
+                        risk_level = 'LOW'
+                        stats['low_risk'] += 1
+                    
+                    if findings.has_metadata:
+                        stats['metadata'] += 1
+                    if findings.has_hidden_text:
+                        stats['hidden_text'] += 1
+                    if findings.has_attachments:
+                        stats['attachments'] += 1
+                    if findings.has_annotations:
+                        stats['annotations'] += 1
+                    if findings.has_forms:
+                        stats['forms'] += 1
+                    if findings.has_ocr_layer:
+                        stats['ocr'] += 1
+                    if findings.has_javascript:
+                        stats['javascript'] += 1
+                    if findings.has_external_links:
+                        stats['links'] += 1
+                    if findings.has_signatures:
+                        stats['signatures'] += 1
+                    if findings.incremental_updates:
+                        stats['incremental'] += 1
+                    
+                    # Log findings for this file with colors
+                    findings_list = []
+                    if findings.has_metadata: findings_list.append(f"{Color.BLUE}Meta:{len(findings.metadata_keys)}{Color.RESET}")
+                    if findings.has_hidden_text: findings_list.append(f"{Color.RED}Hidden:{','.join(findings.hidden_text_types)}{Color.RESET}")
+                    if findings.has_javascript: findings_list.append(f"{Color.MAGENTA}JS:{findings.javascript_count}{Color.RESET}")
+                    if findings.has_signatures: findings_list.append(f"{Color.YELLOW}Sig:{findings.signature_count}{Color.RESET}")
+                    if findings.has_external_links: findings_list.append(f"{Color.CYAN}URLs:{len(findings.external_urls)}{Color.RESET}")
+                    if findings.has_attachments: findings_list.append(f"{Color.GREEN}Attach:{findings.attachment_count}{Color.RESET}")
+                    if findings.has_annotations: findings_list.append(f"{Color.GRAY}Anno:{findings.annotation_count}{Color.RESET}")
+                    if findings.has_forms: findings_list.append(f"{Color.WHITE}Forms:{findings.form_field_count}{Color.RESET}")
+                    if findings.incremental_updates: findings_list.append(f"{Color.DIM}Incr:{findings.version_count}{Color.RESET}")
+                    
+                    # Print detailed log for non-LOW risk files or files with interesting findings
+                    if risk_level != 'LOW' or findings_list:
+                        print(f"\r{'':120}\r", end='')  # Clear line
+                        findings_str = ' | '.join(findings_list) if findings_list else f'{Color.GREEN}clean{Color.RESET}'
+                        
+                        # Color code risk level
+                        if risk_level == 'HIGH':
+                            risk_color = f"{Color.RED}{Color.BOLD}{risk_level}{Color.RESET}"
+                        elif risk_level == 'MEDIUM':
+                            risk_color = f"{Color.YELLOW}{risk_level}{Color.RESET}"
+                        else:
+                            risk_color = f"{Color.GREEN}{risk_level}{Color.RESET}"
+                        
+                        print(f"{Color.GRAY}[{i:4d}]{Color.RESET} {risk_color:6s} {Color.DIM}({findings.risk_score:3.0f}){Color.RESET} | {Color.WHITE}{filename[:45]:<45s}{Color.RESET} | {findings_str}")
+                        print(f"[{bar}] {Color.CYAN}{pct:5.1f}%{Color.RESET} | {Color.WHITE}{i:4d}/{total}{Color.RESET} | {Color.MAGENTA}{speed:.1f} doc/s{Color.RESET} | ETA: {Color.YELLOW}{eta_str}{Color.RESET} | {Color.RED}H:{stats['high_risk']}{Color.RESET} {Color.YELLOW}M:{stats['medium_risk']}{Color.RESET} {Color.GREEN}L:{stats['low_risk']}{Color.RESET}", end='', flush=True)
+                    
+                    # Keep only the highest scores seen so far for the summary
+                    entry = (findings.risk_score, -i, filename, risk_level)
+                    if len(top_risk) < TOP_RISK_COUNT:
+                        heapq.heappush(top_risk, entry)
+                    else:
+                        heapq.heappushpop(top_risk, entry)
+                    
+                    # Write result
+                    writer.writerow({
+                        'filename': filename,
+                        'risk_score': findings.risk_score,
+                        'risk_level': risk_level,
+                        'has_metadata': 'YES' if findings.has_metadata else 'NO',
+                        'metadata_count': len(findings.metadata_keys),
+                        'metadata_keys': ', '.join(findings.metadata_keys) if findings.metadata_keys else '',
+                        'has_hidden_text': 'YES' if findings.has_hidden_text else 'NO',
+                        'hidden_text_types': ', '.join(findings.hidden_text_types) if findings.hidden_text_types else '',
+                        'white_on_white_pages': ', '.join(map(str, findings.white_on_white_pages)) if findings.white_on_white_pages else '',
+                        'offpage_text_pages': ', '.join(map(str, findings.offpage_text_pages)) if findings.offpage_text_pages else '',
+                        'overlay_risk': findings.overlay_risk,
+                        'has_attachments': 'YES' if findings.has_attachments else 'NO',
+                        'attachment_count': findings.attachment_count,
+                        'attachment_names': ', '.join(findings.attachment_names) if findings.attachment_names else '',
+                        'has_annotations': 'YES' if findings.has_annotations else 'NO',
+                        'annotation_count': findings.annotation_count,
+                        'annotation_types': ', '.join(findings.annotation_types) if findings.annotation_types else '',
+                        'has_forms': 'YES' if findings.has_forms else 'NO',
+                        'form_field_count': findings.form_field_count,
+                        'reviewer_names': ', '.join(findings.reviewer_names) if findings.reviewer_names else '',
+                        'has_ocr_layer': 'YES' if findings.has_ocr_layer else 'NO',
+                        'is_scanned': 'YES' if findings.is_scanned else 'NO',
+                        'ocr_pages_count': len(findings.ocr_pages),
+                        'has_javascript': 'YES' if findings.has_javascript else 'NO',
+                        'javascript_count': findings.javascript_count,
+                        'has_external_links': 'YES' if findings.has_external_links else 'NO',
+                        'external_url_count': len(findings.external_urls),
+                        'external_urls': ', '.join(findings.external_urls[:5]) if findings.external_urls else '',
+                        'has_remote_resources': 'YES' if findings.has_remote_resources else 'NO',
+                        'has_signatures': 'YES' if findings.has_signatures else 'NO',
+                        'signature_count': findings.signature_count,
+                        'signer_names': ', '.join(findings.signer_names) if findings.signer_names else '',
+                        'has_layers': 'YES' if findings.has_layers else 'NO',
+                        'layer_count': findings.layer_count,
+                        'incremental_updates': 'YES' if findings.incremental_updates else 'NO',
+                        'version_count': findings.version_count,
+                        'has_structure_tags': 'YES' if findings.has_structure_tags else 'NO',
+                        'has_alt_text': 'YES' if findings.has_alt_text else 'NO',
+                        'has_watermarks': 'YES' if findings.has_watermarks else 'NO',
+                        'has_actions': 'YES' if findings.has_actions else 'NO',
+                        'has_thumbnails': 'YES' if findings.has_thumbnails else 'NO',
+                        'notes': '; '.join(findings.notes) if findings.notes else ''
+                    })
+                    
+                except Exception as e:
+                    stats['errors'] += 1
+                    # Clear progress line and show detailed error
+                    print(f"\r{'':120}\r", end='')  # Clear line
+                    print(f"{Color.GRAY}[{i:4d}]{Color.RESET} {Color.RED}{Color.BOLD}⚠️  ERROR{Color.RESET} | {Color.WHITE}{filename[:45]:<45s}{Color.RESET} | {Color.RED}{type(e).__name__}{Color.RESET}: {Color.GRAY}{str(e)[:60]}{Color.RESET}")
+                    print(f"[{bar}] {Color.CYAN}{pct:5.1f}%{Color.RESET} | {Color.WHITE}{i:4d}/{total}{Color.RESET} | {Color.MAGENTA}{speed:.1f} doc/s{Color.RESET} | ETA: {Color.YELLOW}{eta_str}{Color.RESET} | {Color.RED}H:{stats['high_risk']}{Color.RESET} {Color.YELLOW}M:{stats['medium_risk']}{Color.RESET} {Color.GREEN}L:{stats['low_risk']}{Color.RESET}", end='', flush=True)
+                    writer.writerow({
+                        'filename': filename,
+                        'risk_score': 0,
+                        'has_metadata': 'NO',
+                        'metadata_count': 0,
+                        'metadata_keys': '',
+                        'has_hidden_text': 'NO',
+                        'hidden_text_types': '',
+                        'white_on_white_pages': '',
+                        'offpage_text_pages': '',
+                        'overlay_risk': 'ERROR',
+                        'has_attachments': 'NO',
+                        'attachment_count': 0,
+                        'attachment_names': '',
+                        'has_annotations': 'NO',
+                        'annotation_count': 0,
+                        'annotation_types': '',
+                        'has_forms': 'NO',
+                        'form_field_count': 0,
+                        'reviewer_names': '',
+                        'has_ocr_layer': 'NO',
+                        'is_scanned': 'NO',
+                        'ocr_pages_count': 0,
+                        'has_javascript': 'NO',
+                        'javascript_count': 0,
+                        'has_external_links': 'NO',
+                        'external_url_count': 0,
+                        'external_urls': '',
+                        'has_remote_resources': 'NO',
+                        'has_signatures': 'NO',
+                        'signature_count': 0,
+                        'signer_names': '',
+                        'has_layers': 'NO',
+                        'layer_count': 0,
+                        'incremental_updates': 'NO',
+                        'version_count': 0,
+                        'has_structure_tags': 'NO',
+                        'has_alt_text': 'NO',
+                        'has_watermarks': 'NO',
+                        'has_actions': 'NO',
+                        'has_thumbnails': 'NO',
+                        'notes': f'ERROR: {str(e)}'
+                    })
+        except BaseException:
+            # Interrupted: drop queued files rather than auditing them all on exit
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
     
     # Clear progress line
     print("\r" + " "*120 + "\r", end='')
-    
-    # Write CSV
     print(f"\n{Color.GRAY}" + "─"*80 + Color.RESET)
-    print(f"\n{Color.BLUE}[>]{Color.RESET} Writing output to CSV...")
-    
-    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-        if results:
-            writer = csv.DictWriter(f, fieldnames=results[0].keys())
-            writer.writeheader()
-            writer.writerows(results)
     
     # Final stats
     elapsed_total = time.time() - start_time
@@ -306,19 +386,18 @@ def scan_directory(pdf_dir: str, output_csv: str):
     print(f"  └─ Incremental:   {Color.CYAN}{stats['incremental']:4d}{Color.RESET} documents")
     
     # Show top 10 highest risk files
-    if results:
-        sorted_results = sorted(results, key=lambda x: x['risk_score'], reverse=True)
-        print(f"\n{Color.BOLD}[TOP 10 HIGHEST RISK FILES]{Color.RESET}")
-        for i, r in enumerate(sorted_results[:10], 1):
+    if top_risk:
+        print(f"\n{Color.BOLD}[TOP {TOP_RISK_COUNT} HIGHEST RISK FILES]{Color.RESET}")
+        for i, (risk_score, _, filename, risk_level) in enumerate(sorted(top_risk, reverse=True), 1):
             # Color code by risk level
-            if r['risk_level'] == 'HIGH':
-                risk_display = f"{Color.RED}{Color.BOLD}{r['risk_level']}{Color.RESET}"
-            elif r['risk_level'] == 'MEDIUM':
-                risk_display = f"{Color.YELLOW}{r['risk_level']}{Color.RESET}"
+            if risk_level == 'HIGH':
+                risk_display = f"{Color.RED}{Color.BOLD}{risk_level}{Color.RESET}"
+            elif risk_level == 'MEDIUM':
+                risk_display = f"{Color.YELLOW}{risk_level}{Color.RESET}"
             else:
-                risk_display = f"{Color.GREEN}{r['risk_level']}{Color.RESET}"
+                risk_display = f"{Color.GREEN}{risk_level}{Color.RESET}"
             
-            print(f"  {Color.GRAY}{i:2d}.{Color.RESET} {Color.WHITE}{r['filename'][:50]:<50s}{Color.RESET} Risk: {Color.CYAN}{r['risk_score']:3.0f}{Color.RESET} ({risk_display})")
+            print(f"  {Color.GRAY}{i:2d}.{Color.RESET} {Color.WHITE}{filename[:50]:<50s}{Color.RESET} Risk: {Color.CYAN}{risk_score:3.0f}{Color.RESET} ({risk_display})")
     
     print(f"\n{Color.BLUE}[>]{Color.RESET} Output saved to: {Color.WHITE}{output_csv}{Color.RESET}")
     print(f"\n{Color.CYAN}" + "█"*80 + f"{Color.RESET}\n")
@@ -188,6 +188,87 @@ class TestOverlapDetection(unittest.TestCase):
         )
 
 
+@unittest.skipUnless(audit.HAS_NUMPY, "NumPy not installed")
+class TestVectorizedOverlaps(unittest.TestCase):
+    """Test the NumPy batch overlap kernel against the per-pair computation."""
+    
+    def test_matches_pairwise_areas(self):
+        """Test that every matrix cell equals compute_overlap_area."""
+        import numpy as np
+        black_rects = [fitz.Rect(0, 0, 10, 10), fitz.Rect(20, 0, 30, 10)]
+        text_rects = [
+            fitz.Rect(5, 5, 15, 15),   # Partial overlap with first
+            fitz.Rect(10, 0, 20, 10),  # Touches both edges only
+            fitz.Rect(22, 2, 28, 8)    # Contained in second
+        ]
+        areas = audit.compute_overlaps_np(
+            np.array(black_rects, dtype=float),
+            np.array(text_rects, dtype=float)
+        )
+        self.assertEqual(areas.shape, (2, 3))
+        for i, black_rect in enumerate(black_rects):
+            for j, text_rect in enumerate(text_rects):
+                self.assertAlmostEqual(
+                    areas[i, j],
+                    audit.compute_overlap_area(black_rect, text_rect),
+                    places=3
+                )
+    
+    def test_stop_after_caps_count(self):
+        """Test that stop_after caps the count like the early-exit loop."""
+        black_rects = [fitz.Rect(0, 0, 10, 10), fitz.Rect(20, 0, 30, 10)]
+        text_rects = [fitz.Rect(0, 0, 30, 10)]
+        self.assertEqual(audit.detect_overlaps(black_rects, text_rects, 4.0), 2)
+        self.assertEqual(audit.detect_overlaps(black_rects, text_rects, 4.0, stop_after=1), 1)
+
+
+class TestTextGridIndex(unittest.TestCase):
+    """Test the grid index used to prune overlap candidates."""
+    
+    def test_query_returns_cell_neighbours_only(self):
+        """Test that a lookup skips text rects in distant cells."""
+        text_rects = [
+            fitz.Rect(5, 5, 15, 10),      # Same cell as the query
+            fitz.Rect(30, 30, 40, 40),    # Spans into the query's cells
+            fitz.Rect(300, 300, 310, 310)  # Far away
+        ]
+        grid = audit.build_text_grid(text_rects, cell_size=32.0)
+        self.assertEqual(audit.query_text_grid(grid, fitz.Rect(0, 0, 35, 20), cell_size=32.0), [0, 1])
+        self.assertEqual(audit.query_text_grid(grid, fitz.Rect(500, 500, 510, 510), cell_size=32.0), [])
+    
+    def test_grid_count_matches_pairwise(self):
+        """Test that the indexed scan counts the same overlaps as the full scan."""
+        black_rects = [fitz.Rect(x, y, x + 20, y + 8) for x in range(0, 400, 25) for y in (0, 100)]
+        text_rects = [fitz.Rect(x, y, x + 30, y + 10) for x in range(0, 400, 40) for y in range(0, 200, 12)]
+        full = [
+            any(audit.compute_overlap_area(b, t) >= 4.0 for t in text_rects)
+            for b in black_rects
+        ]
+        grid = audit.build_text_grid(text_rects)
+        indexed = [
+            any(audit.compute_overlap_area(b, text_rects[i]) >= 4.0 for i in audit.query_text_grid(grid, b))
+            for b in black_rects
+        ]
+        self.assertEqual(indexed, full)
+    
+    def test_band_query_keeps_level_lines_only(self):
+        """Test that a y-band lookup skips the lines above and below a rect."""
+        text_rects = [
+            (0, 40, 100, 50),   # Line below
+            (0, 20, 100, 30),   # Level with the query
+            (0, 0, 100, 10)     # Line above
+        ]
+        bands = audit.build_text_bands(text_rects)
+        self.assertEqual(audit.query_text_bands(bands, (0, 22, 300, 28)), [(0, 20, 100, 30)])
+        self.assertEqual(audit.query_text_bands(bands, (0, 60, 300, 70)), [])
+    
+    def test_band_query_keeps_tall_spans(self):
+        """Test that a span starting well above a rect is still a candidate."""
+        text_rects = [(0, 0, 100, 10), (200, 5, 210, 45)]
+        bands = audit.build_text_bands(text_rects)
+        self.assertIn((200, 5, 210, 45), audit.query_text_bands(bands, (150, 38, 300, 42)))
+
+
 class TestPageRiskDataclass(unittest.TestCase):
     """Test PageRisk dataclass."""
     
@@ -132,8 +132,8 @@ def extract_overlapped_text(
             if page_num % 10 == 0:
                 print(f"  Processed {page_num}/{total_pages} pages...", file=sys.stderr)
             
-            # Extract black rectangles
-            black_rects = extract_black_rectangles(page, black_threshold)
+            # Extract black rectangles (as Rects: their bounds are reported below)
+            black_rects = [fitz.Rect(r) for r in extract_black_rectangles(page, black_threshold)]
             
             if not black_rects:
                 continue